@@ -0,0 +1,39 @@
+# Benchmark: NumPy rolling-row knapsack vs the original list-of-lists DP
+#
+# Run from the repository root:  python -m benchmarks.bench_knapsack [--full]
+# The list-of-lists DP needs n * W Python ints, so by default it is only run up
+# to LEGACY_CELLS table cells; --full also runs it at n=200, W=10^6.
+import sys
+import time
+
+import numpy as np
+
+from utils.knapsack import knapsack, knapsack_lists
+
+LEGACY_CELLS = 2 * 10 ** 7
+
+def instance(n, capacity, seed=0):
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, capacity // 10 + 2, n).tolist()
+    values = rng.integers(1, 1000, n).tolist()
+    return weights, values
+
+def main():
+    full = "--full" in sys.argv
+    print(f"{'n':>5} {'W':>9} {'lists (s)':>10} {'numpy (s)':>10} {'speedup':>8}")
+    for n, capacity in [(200, 10 ** 4), (200, 10 ** 5), (200, 10 ** 6)]:
+        weights, values = instance(n, capacity)
+        start = time.perf_counter()
+        result = knapsack(weights, values, capacity)
+        new_time = time.perf_counter() - start
+
+        if full or n * capacity <= LEGACY_CELLS:
+            start = time.perf_counter()
+            assert knapsack_lists(weights, values, capacity) == result, "results differ"
+            old_time = time.perf_counter() - start
+            print(f"{n:>5} {capacity:>9} {old_time:>10.2f} {new_time:>10.3f} {old_time / new_time:>7.0f}x")
+        else:
+            print(f"{n:>5} {capacity:>9} {'skipped':>10} {new_time:>10.3f} {'-':>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# Benchmark: parallel N-Queens counting speedup by worker count, checked
+# against OEIS A000170
+#
+# Run from the repository root:  python -m benchmarks.bench_nqueens [N]
+import os
+import sys
+import time
+
+from utils.nqueens import count_nqueens, count_nqueens_parallel
+
+# OEIS A000170: number of ways to place n non-attacking queens on an n x n board
+A000170 = [1, 1, 0, 0, 2, 10, 4, 40, 92, 352, 724, 2680, 14200, 73712, 365596,
+           2279184, 14772512, 95815104, 666090624]
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 14
+
+    for small in range(1, 13):
+        assert count_nqueens(small) == A000170[small], f"count mismatch for N={small}"
+
+    start = time.perf_counter()
+    serial = count_nqueens(n)
+    baseline = time.perf_counter() - start
+    assert serial == A000170[n], f"serial count mismatch for N={n}"
+    print(f"N={n}: {serial:,} solutions")
+    print(f"{'workers':>7} {'time (s)':>9} {'speedup':>8}")
+    print(f"{'serial':>7} {baseline:>9.2f} {1.0:>7.2f}x")
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    for workers in counts:
+        start = time.perf_counter()
+        for _, _, total in count_nqueens_parallel(n, workers):
+            pass
+        elapsed = time.perf_counter() - start
+        assert total == A000170[n], f"parallel count mismatch for N={n} with {workers} workers"
+        print(f"{workers:>7} {elapsed:>9.2f} {baseline / elapsed:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
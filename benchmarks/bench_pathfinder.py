@@ -0,0 +1,69 @@
+# Benchmark: raster GIF maze animation vs the original per-frame matplotlib figures
+#
+# Run from the repository root:  python -m benchmarks.bench_pathfinder
+import io
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+
+from utils.pathfinder import dfs_animated, draw_cell, render_trace_gif, replay_trace
+
+# The original frame loop from run_pathfinder_app: one figure, rows x cols
+# patches, a PNG encode and a PIL decode per frame
+def matplotlib_frame(grid, start, end, visited_cells, path_cells):
+    rows, cols = grid.shape
+    fig, ax = plt.subplots(figsize=(cols / 2, rows / 2))
+    ax.set_xlim(0, cols)
+    ax.set_ylim(0, rows)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    for i in range(rows):
+        for j in range(cols):
+            if grid[i][j] == 1:
+                draw_cell(ax, i, j, "wall")
+            elif np.random.rand() < 0.1:
+                draw_cell(ax, i, j, "house")
+            else:
+                draw_cell(ax, i, j, "road")
+    draw_cell(ax, *start, "start")
+    draw_cell(ax, *end, "end")
+    for cell in visited_cells:
+        if cell != start and cell != end:
+            draw_cell(ax, cell[0], cell[1], "visited")
+    for cell in path_cells:
+        if cell != start and cell != end:
+            draw_cell(ax, cell[0], cell[1], "path")
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png')
+    plt.close(fig)
+    buf.seek(0)
+    return Image.open(buf)
+
+def main(sample_frames=30):
+    print(f"{'grid':>7} {'frames':>7} {'matplotlib ms/frame':>20} {'raster ms/frame':>16} {'speedup':>8}")
+    for size in (10, 20):
+        grid = np.zeros((size, size), dtype=int)
+        grid[size // 2, :size - 3] = 1
+        start, end = (0, 0), (size - 1, size - 1)
+        _, trace = dfs_animated(grid, start, end)
+
+        begin = time.perf_counter()
+        for idx, (visited_cells, path_cells) in enumerate(replay_trace(trace, size)):
+            if idx == sample_frames:
+                break
+            matplotlib_frame(grid, start, end, visited_cells, path_cells)
+        old_per_frame = (time.perf_counter() - begin) / min(sample_frames, len(trace))
+
+        begin = time.perf_counter()
+        render_trace_gif(grid, trace, start, end)
+        new_per_frame = (time.perf_counter() - begin) / len(trace)
+
+        print(f"{size:>3}x{size:<3} {len(trace):>7} {old_per_frame * 1000:>20.2f} {new_per_frame * 1000:>16.3f} "
+              f"{old_per_frame / new_per_frame:>7.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# Benchmark: packed-integer 8-puzzle A* (Manhattan and pattern database)
+# vs the original list-of-lists solver
+#
+# Run from the repository root:  python -m benchmarks.bench_puzzle8
+import time
+
+from utils.puzzle8 import load_pattern_database, solve_packed, solve_puzzle, solve_puzzle_lists
+
+# Fixed scrambled boards, from a few moves away up to the 31-move worst cases
+BOARDS = [
+    [[1, 2, 3], [4, 0, 6], [7, 5, 8]],
+    [[4, 1, 3], [7, 2, 6], [0, 5, 8]],
+    [[1, 6, 2], [5, 7, 3], [0, 4, 8]],
+    [[5, 1, 8], [0, 7, 3], [4, 6, 2]],
+    [[8, 1, 3], [4, 0, 2], [7, 6, 5]],
+    [[6, 4, 7], [8, 5, 0], [3, 2, 1]],
+    [[8, 6, 7], [2, 5, 4], [3, 0, 1]],
+]
+
+def time_solver(solver, board, *args):
+    start = time.perf_counter()
+    path = solver([row[:] for row in board], *args)
+    return time.perf_counter() - start, path
+
+def main():
+    load_pattern_database()
+    print(f"{'board':<14} {'moves':>5} {'lists (s)':>10} {'packed (s)':>10} {'speedup':>8} "
+          f"{'frontier':>9} {'closed':>7} {'pdb (s)':>8} {'pdb closed':>10}")
+    for board in BOARDS:
+        old_time, old_path = time_solver(solve_puzzle_lists, board)
+        new_time, new_path = time_solver(solve_puzzle, board)
+        pdb_time, pdb_path = time_solver(solve_puzzle, board, "pdb")
+        assert new_path == old_path, f"paths differ for {board}"
+        assert len(pdb_path) == len(old_path), f"pattern database path is not optimal for {board}"
+        stats, pdb_stats = {}, {}
+        solve_packed(board, stats)
+        solve_packed(board, pdb_stats, "pdb")
+        label = "/".join("".join(map(str, row)) for row in board)
+        print(f"{label:<14} {len(new_path) - 1:>5} {old_time:>10.3f} {new_time:>10.3f} "
+              f"{old_time / max(new_time, 1e-9):>7.1f}x {stats['peak_frontier']:>9} {stats['closed']:>7} "
+              f"{pdb_time:>8.3f} {pdb_stats['closed']:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Benchmark: bitmask + propagation and Dancing Links Sudoku engines vs the original backtracking
+#
+# Run from the repository root:  python -m benchmarks.bench_sudoku [--file PATH] [--legacy]
+# HARD_PUZZLES is a small corpus of well-known hard boards and minimal 17-clue
+# puzzles; --file reads any corpus in the usual one-puzzle-per-line 81-character
+# format ('0' or '.' for empty cells, e.g. top95.txt). The original solver can
+# take minutes on some of these, so it only runs on the first LEGACY_PUZZLES
+# boards unless --legacy is given. The DLX column counts solutions up to 2, so it
+# also confirms which boards are unique.
+import sys
+import time
+
+import numpy as np
+
+from utils.sudoku_solver import UNITS, solve_sudoku, solve_sudoku_backtracking, count_sudoku_solutions
+
+HARD_PUZZLES = [
+    ("Inkala 2012", "800000000003600000070090200050007000000045700000100030001000068008500010090000400"),
+    ("Norvig hardest #3", "85...24..72......9..4.........1.7..23.5...9...4...........8..7..17..........36.4."),
+    ("Norvig hardest #1", "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......"),
+    ("Norvig hardest #2", "..53.....8......2..7..1.5..4....53...1..7...6..32...8..6.5....9..4....3......97.."),
+    ("Easter Monster", "1.......2.9.4...5...6...7...5.9.3.......7.......85..4.7.....6...3...9.8...2.....1"),
+    ("Norvig hard1 (not unique)", ".....6....59.....82....8....45........3........6..3.54...325..6.................."),
+    ("17-clue #1", "000000010400000000020000000000050407008000300001090000300400200050100000000806000"),
+    ("17-clue #2", "000000010400000000020000000000050604008000300001090000300400200050100000000807000"),
+    ("17-clue #3", "000000012000035000000600070700000300000400800100000000000120000080000040050000600"),
+    ("17-clue #4", "000000012003600000000007000410020000000500300700000600280000040000300500000000000"),
+    ("17-clue #5", "000000012008030000000000040120500000000004700060000000507000300000620000000100000"),
+]
+LEGACY_PUZZLES = 2
+
+def parse_puzzle(line):
+    line = line.strip().replace(".", "0")
+    return [[int(line[r * 9 + c]) for c in range(9)] for r in range(9)]
+
+def check_solution(puzzle, board):
+    flat = [v for row in board for v in row]
+    assert all(sorted(flat[i] for i in unit) == list(range(1, 10)) for unit in UNITS), "invalid grid"
+    assert all(p in (0, v) for p, v in zip((v for row in puzzle for v in row), flat)), "clues changed"
+
+def load_corpus(path):
+    with open(path) as f:
+        lines = [line.strip() for line in f if len(line.strip()) >= 81]
+    return [(f"{path}:{i + 1}", line[:81]) for i, line in enumerate(lines)]
+
+def main():
+    corpus = load_corpus(sys.argv[sys.argv.index("--file") + 1]) if "--file" in sys.argv else HARD_PUZZLES
+    legacy = "--legacy" in sys.argv
+    print(f"{'puzzle':<28} {'original (s)':>13} {'bitmask (ms)':>13} {'nodes':>6} {'guesses':>8} {'dlx count (ms)':>15} {'sols':>5}")
+    times = []
+    for index, (name, line) in enumerate(corpus):
+        puzzle = parse_puzzle(line)
+        board = [row[:] for row in puzzle]
+        stats = {}
+        start = time.perf_counter()
+        assert solve_sudoku(board, stats), f"{name}: no solution"
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        check_solution(puzzle, board)
+
+        start = time.perf_counter()
+        solutions = count_sudoku_solutions(puzzle)
+        dlx = time.perf_counter() - start
+
+        old = "skipped"
+        if legacy or index < LEGACY_PUZZLES:
+            reference = [row[:] for row in puzzle]
+            start = time.perf_counter()
+            solve_sudoku_backtracking(reference)
+            old = f"{time.perf_counter() - start:.2f}"
+            check_solution(puzzle, reference)
+        if len(corpus) <= 100:
+            print(f"{name:<28} {old:>13} {elapsed * 1000:>13.1f} {stats['nodes']:>6} {stats['guesses']:>8} {dlx * 1000:>15.1f} {solutions:>5}")
+
+    times = np.array(times) * 1000
+    print(f"\n{len(times)} puzzles: mean {times.mean():.1f} ms, median {np.median(times):.1f} ms, "
+          f"max {times.max():.1f} ms, total {times.sum() / 1000:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Benchmark: batch Sudoku solving across a process pool
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_sudoku_batch [--file PATH] [--puzzles N] [--workers W] [--out PATH]
+# Without --file the pack is N random puzzles (a shuffled full grid with most
+# clues removed, so many are not unique) with the HARD_PUZZLES corpus mixed in.
+# Every solved grid is checked, and the solution counts of the first CHECKED
+# puzzles are compared with the Dancing Links counter.
+import random
+import sys
+import time
+
+from benchmarks.bench_sudoku import HARD_PUZZLES, parse_puzzle, check_solution
+from utils.sudoku_solver import (solve_puzzle_batch, batch_summary, write_batch_results, load_puzzle_file,
+                                 count_sudoku_solutions, random_full_grid, GUESS_LABELS)
+
+PACK_SIZE = 20000
+CHECKED = 2000
+
+def random_pack(n, seed=0):
+    rng = random.Random(seed)
+    puzzles = []
+    for i in range(n):
+        if i % 100 == 0:
+            line = HARD_PUZZLES[(i // 100) % len(HARD_PUZZLES)][1]
+        else:
+            cells = [v for row in random_full_grid(3, rng) for v in row]
+            blanks = rng.sample(range(81), rng.randint(45, 56))
+            for cell in blanks:
+                cells[cell] = 0
+            line = "".join(map(str, cells))
+        puzzles.append((i + 1, line))
+    return puzzles
+
+def option(name, default):
+    return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+def main():
+    workers = int(option("--workers", 0)) or None
+    path = option("--file", None)
+    puzzles = load_puzzle_file(path) if path else random_pack(int(option("--puzzles", PACK_SIZE)))
+
+    start = time.perf_counter()
+    records = list(solve_puzzle_batch(puzzles, workers))
+    elapsed = time.perf_counter() - start
+
+    for index, record in enumerate(records):
+        if record["error"]:
+            continue
+        puzzle = parse_puzzle(record["puzzle"])
+        if record["solutions"]:
+            check_solution(puzzle, parse_puzzle(record["solution"]))
+        if index < CHECKED:
+            assert count_sudoku_solutions(puzzle) == record["solutions"], f"line {record['line']}: count differs"
+
+    summary = batch_summary(records, elapsed)
+    print(f"{summary['puzzles']} puzzles in {elapsed:.2f} s: {summary['per_second']:.0f} puzzles/s")
+    print(f"unique {summary['unique']}, multiple {summary['multiple']}, "
+          f"no solution {summary['unsolvable']}, invalid {summary['invalid']}")
+    print(f"ms per puzzle: p50 {summary['ms_p50']:.2f}  p90 {summary['ms_p90']:.2f}  "
+          f"p99 {summary['ms_p99']:.2f}  max {summary['ms_max']:.1f}")
+    print(f"search nodes: p50 {summary['nodes_p50']:.0f}  p90 {summary['nodes_p90']:.0f}  "
+          f"p99 {summary['nodes_p99']:.0f}  max {summary['nodes_max']}")
+    print(f"slowest 1% of puzzles: {summary['slowest_share']:.0%} of the solving time")
+    print("guesses: " + "  ".join(f"{label}: {count}" for label, count in zip(GUESS_LABELS, summary["guesses"])))
+
+    if "--out" in sys.argv:
+        with open(option("--out", None), "w", newline="") as f:
+            write_batch_results(records, f)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Benchmark: filling a pool of generated puzzles for every difficulty
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_sudoku_generate [--puzzles N] [--workers W] [--symmetric]
+# Every puzzle is checked against its solution and re-graded, and the first
+# CHECKED of each pool are confirmed unique with the Dancing Links counter.
+import sys
+import time
+
+from utils.sudoku_solver import DIFFICULTIES, generate_puzzle_pool, grade_puzzle, count_sudoku_solutions
+
+POOL_SIZE = 1000
+CHECKED = 200
+
+def option(name, default):
+    return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+def main():
+    count = int(option("--puzzles", POOL_SIZE))
+    workers = int(option("--workers", 0)) or None
+    symmetric = "--symmetric" in sys.argv
+    print(f"{'difficulty':<10} {'seconds':>8} {'puzzles/s':>10} {'clues':>6} {'nodes':>6}")
+    for difficulty in DIFFICULTIES:
+        start = time.perf_counter()
+        pool = list(generate_puzzle_pool(difficulty, count, workers, symmetric=symmetric))
+        elapsed = time.perf_counter() - start
+
+        for index, record in enumerate(pool):
+            cells = [int(ch) for ch in record["puzzle"]]
+            board = [cells[r * 9:r * 9 + 9] for r in range(9)]
+            assert all(v in (0, int(s)) for v, s in zip(cells, record["solution"])), "clue differs from solution"
+            assert grade_puzzle(board)["difficulty"] == difficulty, "grade differs"
+            if symmetric:
+                assert all((cells[i] == 0) == (cells[80 - i] == 0) for i in range(81)), "clues not symmetric"
+            if index < CHECKED:
+                assert count_sudoku_solutions(board) == 1, "puzzle is not unique"
+        clues = sum(record["clues"] for record in pool) / len(pool)
+        nodes = sum(record["nodes"] for record in pool) / len(pool)
+        print(f"{difficulty:<10} {elapsed:>8.2f} {len(pool) / elapsed:>10.1f} {clues:>6.1f} {nodes:>6.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Benchmark: Held-Karp DP vs brute-force permutations for the TSP
+#
+# Run from the repository root:  python -m benchmarks.bench_tsp
+# First checks Held-Karp against brute force on random symmetric and asymmetric
+# matrices for n <= 9 (exact tour length, valid route), then times Held-Karp on
+# random Euclidean instances up to 20 cities, and the 2-opt/Or-opt heuristic on
+# 500 to 5000 cities (length, gap to the 1-tree lower bound, improving moves).
+# Last, the input pipeline: building Euclidean / haversine matrices, validating
+# them and loading them back from .npy, in milliseconds.
+import io
+import time
+
+import numpy as np
+
+from utils.travel_route import (calculate_total_distance, solve_tsp_brute_force, solve_tsp_held_karp, solve_tsp_heuristic,
+                                distance_matrix, validate_distances, load_distance_matrix)
+
+CHECK_TRIALS = 20
+
+def random_matrix(n, rng, symmetric=True):
+    d = rng.integers(1, 1000, (n, n))
+    if symmetric:
+        d = np.triu(d, 1)
+        d = d + d.T
+    np.fill_diagonal(d, 0)
+    return d
+
+def euclidean_matrix(n, rng):
+    points = rng.random((n, 2)) * 1000
+    return np.sqrt(((points[:, None] - points[None]) ** 2).sum(axis=-1))
+
+def check_exact(rng):
+    print(f"{'n':>3} {'brute (s)':>10} {'held-karp (s)':>14} {'checked':>8}")
+    for n in range(3, 10):
+        trials = CHECK_TRIALS if n < 9 else 4
+        brute_time = dp_time = 0.0
+        for trial in range(trials):
+            d = random_matrix(n, rng, symmetric=trial % 2 == 0)
+            start = time.perf_counter()
+            _, expected = solve_tsp_brute_force(d)
+            brute_time += time.perf_counter() - start
+            start = time.perf_counter()
+            route, distance = solve_tsp_held_karp(d)
+            dp_time += time.perf_counter() - start
+            assert distance == expected, f"n={n}: held-karp {distance} != brute force {expected}"
+            assert sorted(route) == list(range(n)) and route[0] == 0, "route is not a tour"
+            assert calculate_total_distance(route, d) == distance, "route length does not match"
+        print(f"{n:>3} {brute_time / trials:>10.4f} {dp_time / trials:>14.4f} {trials:>8}")
+
+def main():
+    rng = np.random.default_rng(0)
+    check_exact(rng)
+    print()
+    print(f"{'n':>3} {'held-karp (s)':>14} {'length':>10}")
+    for n in [12, 14, 16, 18, 20]:
+        d = euclidean_matrix(n, rng)
+        start = time.perf_counter()
+        route, distance = solve_tsp_held_karp(d)
+        elapsed = time.perf_counter() - start
+        assert abs(calculate_total_distance(route, d) - distance) < 1e-6
+        print(f"{n:>3} {elapsed:>14.3f} {distance:>10.1f}")
+
+    print()
+    print(f"{'n':>5} {'start':>8} {'time (s)':>9} {'length':>9} {'bound':>9} {'gap':>6} {'moves':>6}")
+    for n in [500, 1000, 2000, 5000]:
+        points = rng.random((n, 2)) * 1000
+        for construction in ["nearest", "greedy"]:
+            stats = {}
+            route, length = solve_tsp_heuristic(points, time_budget=60, construction=construction, stats=stats)
+            assert sorted(route) == list(range(n)), "route is not a tour"
+            print(f"{n:>5} {construction:>8} {stats['seconds']:>9.2f} {length:>9.0f} {stats['lower_bound']:>9.0f} "
+                  f"{stats['gap']:>6.1%} {stats['iterations']:>6}")
+
+    print()
+    print(f"{'n':>5} {'euclid (ms)':>12} {'haversine (ms)':>15} {'validate (ms)':>14} {'npy load (ms)':>14} {'MB':>6}")
+    for n in [1000, 2000, 5000]:
+        coords = np.column_stack((rng.uniform(-60, 60, n), rng.uniform(-180, 180, n)))
+        start = time.perf_counter()
+        distances = distance_matrix(coords)
+        euclid = time.perf_counter() - start
+        start = time.perf_counter()
+        distance_matrix(coords, "haversine")
+        haversine = time.perf_counter() - start
+        start = time.perf_counter()
+        assert not validate_distances(distances)
+        validate = time.perf_counter() - start
+        buffer = io.BytesIO()
+        np.save(buffer, distances)
+        start = time.perf_counter()
+        load_distance_matrix(buffer.getvalue())
+        load = time.perf_counter() - start
+        print(f"{n:>5} {euclid * 1000:>12.0f} {haversine * 1000:>15.0f} {validate * 1000:>14.0f} "
+              f"{load * 1000:>14.0f} {distances.nbytes / 2 ** 20:>6.0f}")
+
+if __name__ == "__main__":
+    main()
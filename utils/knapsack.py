@@ -5,8 +5,263 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.animation import FuncAnimation
 import numpy as np
+import pandas as pd
+import bisect
+import io
+import heapq
+import itertools
 
+# Bottom-up 0/1 knapsack in NumPy: one value row is updated per item with a shifted
+# np.maximum, and whether the item was taken at each capacity is kept as one bit
+# per cell (np.packbits), so memory is n * (W + 1) / 8 bytes instead of a full
+# table of Python ints. Items are taken only when strictly better, exactly as the
+# table walk below does, so `selected` matches the list-of-lists version.
 def knapsack(weights, values, capacity):
+    n = len(weights)
+    row = np.zeros(capacity + 1, dtype=np.int64)
+    choices = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8)
+    taken = np.zeros(capacity + 1, dtype=bool)
+
+    for i in range(n):
+        w, v = int(weights[i]), int(values[i])
+        if w > capacity:
+            continue
+        candidate = row[:capacity + 1 - w] + v
+        taken[:w] = False
+        np.greater(candidate, row[w:], out=taken[w:])
+        np.maximum(row[w:], candidate, out=row[w:])
+        choices[i] = np.packbits(taken)
+
+    w = capacity
+    selected = []
+    for i in range(n - 1, -1, -1):
+        if (choices[i, w >> 3] >> (7 - (w & 7))) & 1:
+            selected.append(i)
+            w -= int(weights[i])
+
+    return int(row[capacity]), selected[::-1]
+
+# Hirschberg-style reconstruction for tables that do not fit in memory: only O(W)
+# value rows are kept. The items are split in half, a forward row over the left half
+# and a row over the right half give the best value for every capacity c and
+# W - c, and the best split capacity sends each half into its own subproblem.
+# Subproblems small enough for the bit table are solved with knapsack directly.
+# Costs about twice the compute of the plain DP.
+TABLE_MEMORY_LIMIT = 256 * 2 ** 20  # bytes of packed choice bits before switching
+
+def knapsack_table_bytes(n, capacity):
+    return n * ((capacity + 8) // 8)
+
+def knapsack_value_row(weights, values, capacity):
+    row = np.zeros(capacity + 1, dtype=np.int64)
+    for w, v in zip(weights, values):
+        w, v = int(w), int(v)
+        if w <= capacity:
+            np.maximum(row[w:], row[:capacity + 1 - w] + v, out=row[w:])
+    return row
+
+def knapsack_hirschberg(weights, values, capacity, memory_limit=TABLE_MEMORY_LIMIT):
+    selected = []
+
+    def solve(items, cap):
+        if not items or cap <= 0:
+            return
+        if len(items) == 1 or knapsack_table_bytes(len(items), cap) <= memory_limit:
+            _, picked = knapsack([weights[i] for i in items], [values[i] for i in items], cap)
+            selected.extend(items[j] for j in picked)
+            return
+        mid = len(items) // 2
+        left, right = items[:mid], items[mid:]
+        forward = knapsack_value_row([weights[i] for i in left], [values[i] for i in left], cap)
+        backward = knapsack_value_row([weights[i] for i in right], [values[i] for i in right], cap)
+        split = int(np.argmax(forward + backward[::-1]))
+        solve(left, split)
+        solve(right, cap - split)
+
+    solve(list(range(len(weights))), capacity)
+    selected.sort()
+    return sum(int(values[i]) for i in selected), selected
+
+# Pick the bit-table DP when its choice bits fit in memory_limit, else Hirschberg
+def solve_knapsack(weights, values, capacity, memory_limit=TABLE_MEMORY_LIMIT):
+    if knapsack_table_bytes(len(weights), capacity) <= memory_limit:
+        return knapsack(weights, values, capacity)
+    return knapsack_hirschberg(weights, values, capacity, memory_limit)
+
+# Best-first branch and bound for small n with huge capacities: items are sorted by
+# value/weight ratio, and a node's Dantzig bound (greedy fill plus a fraction of
+# the first item that does not fit) comes from prefix sums and a binary search.
+# Nodes whose bound cannot beat the best complete solution are pruned. Taken
+# items are kept as a linked chain (item, parent) shared between nodes.
+def knapsack_branch_and_bound(weights, values, capacity):
+    order = sorted((i for i in range(len(weights)) if weights[i] <= capacity),
+                   key=lambda i: values[i] / weights[i], reverse=True)
+    ws = [int(weights[i]) for i in order]
+    vs = [int(values[i]) for i in order]
+    n = len(order)
+    prefix_w = [0] + list(itertools.accumulate(ws))
+    prefix_v = [0] + list(itertools.accumulate(vs))
+
+    def bound(level, value, room):
+        # Items level..end-1 fit whole; the next one contributes the fraction that fits
+        end = bisect.bisect_right(prefix_w, prefix_w[level] + room, lo=level) - 1
+        total = value + prefix_v[end] - prefix_v[level]
+        if end < n:
+            total += (room - (prefix_w[end] - prefix_w[level])) * vs[end] / ws[end]
+        return total
+
+    best_value, best_chain = 0, None
+    queue = [(-bound(0, 0, capacity), 0, 0, capacity, None)]
+    while queue:
+        neg_bound, level, value, room, chain = heapq.heappop(queue)
+        if -neg_bound <= best_value:
+            break  # Best-first: no remaining node can improve
+        if level == n:
+            continue
+        # Take item `level`
+        if ws[level] <= room:
+            taken_value = value + vs[level]
+            taken_chain = (level, chain)
+            if taken_value > best_value:
+                best_value, best_chain = taken_value, taken_chain
+            b = bound(level + 1, taken_value, room - ws[level])
+            if b > best_value:
+                heapq.heappush(queue, (-b, level + 1, taken_value, room - ws[level], taken_chain))
+        # Skip item `level`
+        b = bound(level + 1, value, room)
+        if b > best_value:
+            heapq.heappush(queue, (-b, level + 1, value, room, chain))
+
+    selected = []
+    while best_chain is not None:
+        level, best_chain = best_chain
+        selected.append(order[level])
+    return best_value, sorted(selected)
+
+# DP indexed by value instead of weight: row[v] is the least weight reaching value
+# exactly v, so the cost is n * sum(values) however large the capacity is. Choices
+# are kept as packed bits like knapsack.
+def knapsack_by_value(weights, values, capacity):
+    n = len(weights)
+    total = int(sum(int(values[i]) for i in range(n) if weights[i] <= capacity))
+    unreachable = np.iinfo(np.int64).max // 2
+    row = np.full(total + 1, unreachable, dtype=np.int64)
+    row[0] = 0
+    choices = np.zeros((n, (total + 8) // 8), dtype=np.uint8)
+    taken = np.zeros(total + 1, dtype=bool)
+
+    for i in range(n):
+        w, v = int(weights[i]), int(values[i])
+        if w > capacity or v <= 0:
+            continue
+        candidate = row[:total + 1 - v] + w
+        taken[:v] = False
+        np.less(candidate, row[v:], out=taken[v:])
+        np.minimum(row[v:], candidate, out=row[v:])
+        choices[i] = np.packbits(taken)
+
+    best = int(np.flatnonzero(row <= capacity)[-1])
+    v = best
+    selected = []
+    for i in range(n - 1, -1, -1):
+        if (choices[i, v >> 3] >> (7 - (v & 7))) & 1:
+            selected.append(i)
+            v -= int(values[i])
+    return best, selected[::-1]
+
+# FPTAS: run the value DP on values scaled down by K = epsilon * max value / n.
+# The chosen items are worth at least (1 - epsilon) of the optimum.
+def knapsack_fptas(weights, values, capacity, epsilon=0.1):
+    fitting = [i for i in range(len(weights)) if weights[i] <= capacity]
+    if not fitting:
+        return 0, []
+    scale = epsilon * max(int(values[i]) for i in fitting) / len(fitting)
+    if scale <= 1:
+        return knapsack_by_value(weights, values, capacity)
+    fits = set(fitting)
+    scaled = [int(int(values[i]) // scale) if i in fits else 0 for i in range(len(values))]
+    _, selected = knapsack_by_value(weights, scaled, capacity)
+    return sum(int(values[i]) for i in selected), selected
+
+# Engine choice from the problem size: the DP over capacity or over total value,
+# whichever has fewer cells, among those under DP_CELL_LIMIT cells whose choice
+# table fits memory_limit; otherwise branch and bound (or the FPTAS when an
+# approximation is acceptable)
+DP_CELL_LIMIT = 5 * 10 ** 8
+
+def choose_knapsack_engine(n, capacity, total_value, epsilon=None, memory_limit=TABLE_MEMORY_LIMIT):
+    candidates = [(n * (size + 1), engine) for size, engine in ((capacity, "weight-dp"), (total_value, "value-dp"))
+                  if n * (size + 1) <= DP_CELL_LIMIT and knapsack_table_bytes(n, size) <= memory_limit]
+    if candidates:
+        return min(candidates, key=lambda candidate: candidate[0])[1]
+    return "fptas" if epsilon else "branch-and-bound"
+
+def knapsack_auto(weights, values, capacity, epsilon=None, memory_limit=TABLE_MEMORY_LIMIT):
+    engine = choose_knapsack_engine(len(weights), capacity, int(sum(int(v) for v in values)),
+                                    epsilon, memory_limit)
+    if engine == "value-dp":
+        return knapsack_by_value(weights, values, capacity)
+    if engine == "weight-dp":
+        return solve_knapsack(weights, values, capacity, memory_limit)
+    if engine == "fptas":
+        return knapsack_fptas(weights, values, capacity, epsilon)
+    return knapsack_branch_and_bound(weights, values, capacity)
+
+# Bounded knapsack by binary splitting: q copies of an item become bundles of
+# 1, 2, 4, ... copies plus a remainder, so any count 0..q is a sum of distinct
+# bundles and the problem becomes a 0/1 knapsack over O(sum log q) bundles,
+# solved with the vectorized DP instead of expanding every copy.
+def split_bounded_items(weights, values, quantities, capacity):
+    bundle_weights, bundle_values, owners, counts = [], [], [], []
+    for i, (w, v, q) in enumerate(zip(weights, values, quantities)):
+        w, v, q = int(w), int(v), min(int(q), capacity // max(int(w), 1))
+        size = 1
+        while q > 0:
+            take = min(size, q)
+            bundle_weights.append(w * take)
+            bundle_values.append(v * take)
+            owners.append(i)
+            counts.append(take)
+            q -= take
+            size *= 2
+    return bundle_weights, bundle_values, np.array(owners, dtype=np.int64), np.array(counts, dtype=np.int64)
+
+# Returns (max_value, quantities) with one chosen copy count per item
+def bounded_knapsack(weights, values, quantities, capacity, memory_limit=TABLE_MEMORY_LIMIT):
+    bundle_weights, bundle_values, owners, counts = split_bounded_items(weights, values, quantities, capacity)
+    max_value, picked = solve_knapsack(bundle_weights, bundle_values, capacity, memory_limit)
+    chosen = np.zeros(len(weights), dtype=np.int64)
+    np.add.at(chosen, owners[picked], counts[picked])
+    return max_value, chosen.tolist()
+
+# Unbounded knapsack: an item can never be used more than capacity // weight times
+def unbounded_knapsack(weights, values, capacity, memory_limit=TABLE_MEMORY_LIMIT):
+    quantities = [capacity // int(w) for w in weights]
+    return bounded_knapsack(weights, values, quantities, capacity, memory_limit)
+
+# Item lists from CSV or Parquet: `weight` and `value` columns are required,
+# `quantity` (default 1) and `name` are optional
+def load_items(name, data):
+    if name.lower().endswith(".parquet"):
+        frame = pd.read_parquet(io.BytesIO(data))
+    else:
+        frame = pd.read_csv(io.BytesIO(data))
+    frame.columns = [str(col).strip().lower() for col in frame.columns]
+    missing = {"weight", "value"} - set(frame.columns)
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(sorted(missing))}")
+    weights = frame["weight"].to_numpy(dtype=np.int64)
+    values = frame["value"].to_numpy(dtype=np.int64)
+    quantities = (frame["quantity"].to_numpy(dtype=np.int64) if "quantity" in frame.columns
+                  else np.ones(len(frame), dtype=np.int64))
+    if (weights < 1).any() or (values < 0).any() or (quantities < 0).any():
+        raise ValueError("weights must be positive; values and quantities non-negative")
+    names = (frame["name"].astype(str).tolist() if "name" in frame.columns
+             else [f"Item {i + 1}" for i in range(len(frame))])
+    return weights.tolist(), values.tolist(), quantities.tolist(), names
+
+# Original list-of-lists DP, kept as a reference for benchmarks
+def knapsack_lists(weights, values, capacity):
     n = len(weights)
     dp = [[0] * (capacity + 1) for _ in range(n + 1)]
 
@@ -56,7 +311,7 @@ def plot_knapsack(weights, values, capacity, selected):
 
 def run_knapsack_app():
     st.set_page_config(page_title="🎒 Knapsack Optimizer", layout="centered")
-    st.title("🎒 0/1 Knapsack Problem Solver")
+    st.title("🎒 Knapsack Problem Solver")
 
     st.markdown("""
     **🔍 Problem Description:**  
@@ -70,30 +325,95 @@ def run_knapsack_app():
     - Asset selection for investments
     """)
 
-    num_items = st.slider("🧮 Number of Items", min_value=1, max_value=20, value=4)
+    source = st.radio("📥 Item Source", ["Enter manually", "Upload CSV / Parquet"], horizontal=True)
+    variant = st.radio("🔁 Item Copies", ["0/1 (each item once)", "Bounded (stock quantity)", "Unbounded"],
+                       horizontal=True)
+    bounded = variant.startswith("Bounded")
 
-    st.subheader("🔢 Item Details")
-    weights, values = [], []
-    for i in range(num_items):
-        cols = st.columns([1, 1])
-        weight = cols[0].number_input(f"Item {i+1} Weight (kg)", min_value=1, value=1, key=f"w_{i}")
-        value = cols[1].number_input(f"Item {i+1} Value (₹)", min_value=1, value=1, key=f"v_{i}")
-        weights.append(weight)
-        values.append(value)
+    if source == "Enter manually":
+        num_items = st.slider("🧮 Number of Items", min_value=1, max_value=20, value=4)
+
+        st.subheader("🔢 Item Details")
+        weights, values, quantities = [], [], []
+        for i in range(num_items):
+            cols = st.columns([1, 1, 1] if bounded else [1, 1])
+            weight = cols[0].number_input(f"Item {i+1} Weight (kg)", min_value=1, value=1, key=f"w_{i}")
+            value = cols[1].number_input(f"Item {i+1} Value (₹)", min_value=1, value=1, key=f"v_{i}")
+            quantity = cols[2].number_input(f"Item {i+1} Stock", min_value=0, value=1, key=f"q_{i}") if bounded else 1
+            weights.append(weight)
+            values.append(value)
+            quantities.append(quantity)
+        names = [f"Item {i + 1}" for i in range(num_items)]
+    else:
+        st.caption("Columns: `weight`, `value`, optional `quantity` (stock, default 1) and `name`.")
+        upload = st.file_uploader("Item list", type=["csv", "parquet"])
+        if upload is None:
+            return
+        try:
+            weights, values, quantities, names = load_items(upload.name, upload.getvalue())
+        except Exception as e:
+            st.error(f"⚠️ Could not read the item list: {e}")
+            return
+        st.caption(f"Loaded {len(weights):,} items.")
 
     capacity = st.number_input("🎯 Knapsack Capacity (kg)", min_value=1, value=10)
 
+    engines = {
+        "Automatic": "auto",
+        "DP over weights": "weight-dp",
+        "DP over values": "value-dp",
+        "Branch and bound": "branch-and-bound",
+        "FPTAS (approximate)": "fptas",
+    }
+    with st.expander("⚙️ Advanced"):
+        engine = "weight-dp"
+        epsilon = None
+        if variant.startswith("0/1"):
+            engine = engines[st.selectbox("Solver engine", list(engines))]
+            epsilon = st.slider("FPTAS epsilon (max relative loss)", 0.01, 0.5, 0.1) if engine == "fptas" else None
+        limit_mb = st.number_input("DP table memory limit (MB)", min_value=1,
+                                   value=TABLE_MEMORY_LIMIT // 2 ** 20)
+    memory_limit = limit_mb * 2 ** 20
+
     if st.button("🚀 Solve Knapsack Problem"):
-        max_value, selected = knapsack(weights, values, capacity)
+        if bounded:
+            max_value, chosen = bounded_knapsack(weights, values, quantities, capacity, memory_limit)
+        elif variant == "Unbounded":
+            max_value, chosen = unbounded_knapsack(weights, values, capacity, memory_limit)
+        else:
+            if engine == "auto":
+                engine = choose_knapsack_engine(len(weights), capacity, sum(values), epsilon, memory_limit)
+            if engine == "value-dp":
+                max_value, selected = knapsack_by_value(weights, values, capacity)
+            elif engine == "branch-and-bound":
+                max_value, selected = knapsack_branch_and_bound(weights, values, capacity)
+            elif engine == "fptas":
+                max_value, selected = knapsack_fptas(weights, values, capacity, epsilon)
+            else:
+                max_value, selected = solve_knapsack(weights, values, capacity, memory_limit)
+            chosen = [0] * len(weights)
+            for idx in selected:
+                chosen[idx] = 1
+            st.caption(f"🧮 Engine: {engine}")
         st.success(f"💰 Maximum Value Achievable: **₹{max_value}**")
 
-        if selected:
+        # Items repeated by chosen quantity, for the breakdown and the plot
+        selected = [idx for idx, qty in enumerate(chosen) for _ in range(qty)]
+        if selected and len(selected) <= 20:
             st.subheader("📋 Selected Items Breakdown")
-            for idx in selected:
-                st.markdown(f"- **Item {idx + 1}** → 🏋️ Weight: **{weights[idx]} kg**, 💵 Value: **₹{values[idx]}**")
+            for idx, qty in enumerate(chosen):
+                if qty:
+                    count = f" × **{qty}**" if qty > 1 else ""
+                    st.markdown(f"- **{names[idx]}**{count} → 🏋️ Weight: **{weights[idx]} kg**, 💵 Value: **₹{values[idx]}**")
 
             fig = plot_knapsack(weights, values, capacity, selected)
             st.pyplot(fig)
+        elif selected:
+            st.subheader("📋 Selected Items Breakdown")
+            st.dataframe([
+                {"item": names[idx], "quantity": qty, "weight": weights[idx], "value": values[idx]}
+                for idx, qty in enumerate(chosen) if qty
+            ])
         else:
             st.warning("⚠️ No items were selected. Try adjusting item weights or increasing the knapsack capacity.")
 
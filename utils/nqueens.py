@@ -1,46 +1,312 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
 
-def is_safe(board, row, col, n):
-    for i in range(col):
-        if board[row][i] == 1:
-            return False
-    for i, j in zip(range(row, -1, -1), range(col, -1, -1)):
-        if board[i][j] == 1:
-            return False
-    for i, j in zip(range(row, n), range(col, -1, -1)):
-        if board[i][j] == 1:
-            return False
-    return True
-
-def solve_nqueens_util(board, col, n):
-    if col >= n:
-        return True
-    for i in range(n):
-        if is_safe(board, i, col, n):
-            board[i][col] = 1
-            if solve_nqueens_util(board, col + 1, n):
-                return True
-            board[i][col] = 0
-    return False
+# Bitmask engine: queens are placed row by row, and three ints track the columns
+# and the two diagonals attacked in the current row, so each candidate check is a
+# single AND instead of a board scan. Placements are one column index per row.
+
+# Left-half first-row columns, with the middle column last for odd n.
+# Mirroring a solution across the vertical axis covers the right half.
+def first_row_columns(n):
+    return list(range(n // 2)) + ([n // 2] if n % 2 else [])
+
+def _placements_from(n, placement, cols, diag_left, diag_right):
+    full = (1 << n) - 1
+    if cols == full:
+        yield list(placement)
+        return
+    avail = full & ~(cols | diag_left | diag_right)
+    while avail:
+        bit = avail & -avail
+        avail ^= bit
+        placement.append(bit.bit_length() - 1)
+        yield from _placements_from(n, placement, cols | bit, ((diag_left | bit) << 1) & full, (diag_right | bit) >> 1)
+        placement.pop()
+
+# Lazily enumerate every solution as a column-per-row list
+def nqueens_placements(n):
+    full = (1 << n) - 1
+    for col in first_row_columns(n):
+        bit = 1 << col
+        mirrored = n % 2 == 0 or col != n // 2
+        for placement in _placements_from(n, [col], bit, (bit << 1) & full, bit >> 1):
+            yield placement
+            if mirrored:
+                yield [n - 1 - c for c in placement]
+
+def solve_nqueens_bitmask(n):
+    return next(nqueens_placements(n), None)
+
+# Counting expands the search tree breadth-first, one NumPy array per mask, so each
+# row is a handful of vectorized ops over every partial placement at that depth.
+# Layers larger than COUNT_CHUNK are split and counted chunk by chunk.
+COUNT_CHUNK = 1 << 16
+
+def _count_layers(cols, diag_left, diag_right, rows_left, full):
+    total = 0
+    while rows_left > 1:
+        if len(cols) > COUNT_CHUNK:
+            for s in range(0, len(cols), COUNT_CHUNK):
+                chunk = slice(s, s + COUNT_CHUNK)
+                total += _count_layers(cols[chunk], diag_left[chunk], diag_right[chunk], rows_left, full)
+            return total
+        avail = full & ~(cols | diag_left | diag_right)
+        next_cols, next_left, next_right = [], [], []
+        while True:
+            keep = avail != 0
+            if not keep.any():
+                break
+            cols, diag_left, diag_right, avail = cols[keep], diag_left[keep], diag_right[keep], avail[keep]
+            bit = avail & (~avail + np.uint32(1))
+            avail ^= bit
+            next_cols.append(cols | bit)
+            next_left.append(((diag_left | bit) << np.uint32(1)) & full)
+            next_right.append((diag_right | bit) >> np.uint32(1))
+        if not next_cols:
+            return total
+        cols = np.concatenate(next_cols)
+        diag_left = np.concatenate(next_left)
+        diag_right = np.concatenate(next_right)
+        rows_left -= 1
+    if rows_left == 0:
+        return total + len(cols)
+    # Last row: at most one free column is left, so each live state is one solution
+    return total + int(np.count_nonzero(full & ~(cols | diag_left | diag_right)))
+
+# Number of solutions extending a partial placement of the first rows
+# (the prefix is assumed conflict-free)
+def count_from_prefix(n, prefix):
+    full = (1 << n) - 1
+    cols = diag_left = diag_right = 0
+    for col in prefix:
+        bit = 1 << col
+        cols |= bit
+        diag_left = ((diag_left | bit) << 1) & full
+        diag_right = (diag_right | bit) >> 1
+    masks = [np.array([mask], dtype=np.uint32) for mask in (cols, diag_left, diag_right)]
+    return _count_layers(*masks, n - len(prefix), np.uint32(full))
+
+# Split the search into independent subproblems, one per conflict-free placement
+# of the first prefix_rows queens. Each comes with its symmetry weight: 2 when the
+# first queen is left of centre (its mirror is never searched), otherwise 1.
+def nqueens_subproblems(n, prefix_rows=2):
+    full = (1 << n) - 1
+    tasks = []
+    for col in first_row_columns(n):
+        weight = 1 if n % 2 and col == n // 2 else 2
+        bit = 1 << col
+        stack = [([col], bit, (bit << 1) & full, bit >> 1)]
+        while stack:
+            prefix, cols, diag_left, diag_right = stack.pop()
+            if len(prefix) == min(prefix_rows, n):
+                tasks.append((prefix, weight))
+                continue
+            avail = full & ~(cols | diag_left | diag_right)
+            while avail:
+                bit = avail & -avail
+                avail ^= bit
+                stack.append((prefix + [bit.bit_length() - 1], cols | bit,
+                              ((diag_left | bit) << 1) & full, (diag_right | bit) >> 1))
+    return tasks
+
+# Count all solutions, solving only the left half of the first row and doubling it
+def count_nqueens(n):
+    if n < 1:
+        return 0
+    return sum(weight * count_from_prefix(n, prefix) for prefix, weight in nqueens_subproblems(n, 1))
+
+# Parallel counting: subproblems go to a process pool as many small tasks, so an
+# idle worker always picks up the next pending one. Yields (tasks done, tasks
+# total, count so far) as results arrive. Closing the generator, or should_stop()
+# returning True, cancels every task that has not started yet.
+def count_nqueens_parallel(n, workers=None, prefix_rows=2, should_stop=None):
+    tasks = nqueens_subproblems(n, prefix_rows) if n >= 1 else []
+    total = 0
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(count_from_prefix, n, prefix): weight for prefix, weight in tasks}
+        for done, future in enumerate(as_completed(futures), 1):
+            total += futures[future] * future.result()
+            yield done, len(futures), total
+            if should_stop is not None and should_stop():
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def placement_to_board(placement):
+    n = len(placement)
+    board = [[0] * n for _ in range(n)]
+    for row, col in enumerate(placement):
+        board[row][col] = 1
+    return board
+
+# Explicit construction (valid for every n >= 4): queens go in the even columns
+# then the odd ones (1-based), with the n mod 6 == 2 and n mod 6 == 3 cases
+# reordered so no two share a diagonal. O(n), no search.
+def construct_nqueens(n):
+    if n in (2, 3):
+        return None
+    evens = list(range(2, n + 1, 2))
+    odds = list(range(1, n + 1, 2))
+    if n % 6 == 2:
+        odds = [3, 1] + odds[3:] + [5]
+    elif n % 6 == 3:
+        evens = evens[1:] + [2]
+        odds = odds[2:] + [1, 3]
+    return [col - 1 for col in evens + odds]
+
+# Min-conflicts local search. Columns are kept a permutation, so only diagonals
+# can clash: a greedy start puts each row on a random free column with empty
+# diagonals when a few tries find one, then every attacked row swaps columns with
+# random rows until a swap lowers the number of diagonal clashes (equal swaps
+# are taken too, and a row stuck for n tries may take a worse one). Diagonal
+# counts are plain lists, so scoring and making a swap are O(1); the attacked
+# rows are collected again (one vectorized pass) only after each sweep. After
+# max_steps swap attempts without a solution it restarts from a fresh start.
+MIN_CONFLICTS_TRIES = 20  # random columns tried per row in the greedy start
+MIN_CONFLICTS_RESTARTS = 50
+MIN_CONFLICTS_NOISE = 0.05  # chance of a worsening swap once a row has failed n tries
+
+def min_conflicts_nqueens(n, max_steps=None, seed=None, restarts=MIN_CONFLICTS_RESTARTS):
+    if n in (2, 3):
+        return None
+    rng = random.Random(seed)
+    max_steps = max_steps or max(100 * n, 5000)
+    for _ in range(restarts + 1):
+        placement = [0] * n
+        sums = [0] * (2 * n - 1)   # queens per row + col diagonal
+        diffs = [0] * (2 * n - 1)  # queens per row - col + n - 1 diagonal
+        free = list(range(n))
+        for row in range(n):
+            for _ in range(min(len(free), MIN_CONFLICTS_TRIES)):
+                k = rng.randrange(len(free))
+                col = free[k]
+                if not sums[row + col] and not diffs[row - col + n - 1]:
+                    break
+            free[k] = free[-1]
+            free.pop()
+            placement[row] = col
+            sums[row + col] += 1
+            diffs[row - col + n - 1] += 1
+
+        rows = np.arange(n)
+        steps = 0
+        while steps < max_steps:
+            cols = np.array(placement)
+            attacked = np.flatnonzero((np.array(sums)[rows + cols] > 1) | (np.array(diffs)[rows - cols + n - 1] > 1))
+            if len(attacked) == 0:
+                return placement
+            for i in attacked.tolist():
+                tries = 0
+                while steps < max_steps:
+                    ci = placement[i]
+                    if sums[i + ci] == 1 and diffs[i - ci + n - 1] == 1:
+                        break  # fixed by an earlier swap
+                    steps += 1
+                    tries += 1
+                    j = rng.randrange(n)
+                    cj = placement[j]
+                    if j == i:
+                        continue
+                    # Lift both queens, then put them back swapped; counting clashes
+                    # queen by queen counts each attacking pair exactly once
+                    sums[i + ci] -= 1
+                    diffs[i - ci + n - 1] -= 1
+                    lost = sums[i + ci] + diffs[i - ci + n - 1]
+                    sums[j + cj] -= 1
+                    diffs[j - cj + n - 1] -= 1
+                    lost += sums[j + cj] + diffs[j - cj + n - 1]
+                    gained = sums[i + cj] + diffs[i - cj + n - 1]
+                    sums[i + cj] += 1
+                    diffs[i - cj + n - 1] += 1
+                    gained += sums[j + ci] + diffs[j - ci + n - 1]
+                    sums[j + ci] += 1
+                    diffs[j - ci + n - 1] += 1
+                    if gained < lost:
+                        placement[i], placement[j] = cj, ci
+                        break
+                    if gained == lost or (tries > n and rng.random() < MIN_CONFLICTS_NOISE):
+                        placement[i], placement[j] = cj, ci  # sideways, or a random kick out of a local minimum
+                        continue
+                    sums[i + cj] -= 1
+                    diffs[i - cj + n - 1] -= 1
+                    sums[j + ci] -= 1
+                    diffs[j - ci + n - 1] -= 1
+                    sums[i + ci] += 1
+                    diffs[i - ci + n - 1] += 1
+                    sums[j + cj] += 1
+                    diffs[j - cj + n - 1] += 1
+    return None
+
+def is_valid_placement(placement):
+    cols = np.asarray(placement)
+    rows = np.arange(len(cols))
+    n = len(cols)
+    return (len(np.unique(cols)) == n and len(np.unique(rows + cols)) == n
+            and len(np.unique(rows - cols)) == n)
+
+# One solution as a column-per-row list: "construct" (O(n) formula),
+# "min-conflicts" (local search) or "backtrack" (bitmask search)
+def solve_nqueens_placement(n, method="construct"):
+    if n < 4:
+        return solve_nqueens_bitmask(n)
+    if method == "min-conflicts":
+        return min_conflicts_nqueens(n)
+    if method == "backtrack":
+        return solve_nqueens_bitmask(n)
+    return construct_nqueens(n)
 
 def solve_nqueens(n):
-    board = [[0 for _ in range(n)] for _ in range(n)]
-    if not solve_nqueens_util(board, 0, n):
+    placement = solve_nqueens_placement(n)
+    if placement is None:
         return None
-    return board
+    return placement_to_board(placement)
+
+# draw_board accepts an N x N board or a column-per-row placement. Boards above
+# LARGE_BOARD are drawn as one raster image (at most MAX_IMAGE_SIDE pixels a side)
+# instead of one patch per square.
+LARGE_BOARD = 32
+MAX_IMAGE_SIDE = 1024
+
+def board_to_placement(board):
+    if len(board) and not isinstance(board[0], (list, tuple, np.ndarray)):
+        return list(board)
+    return [list(row).index(1) for row in board]
+
+def draw_board_image(placement):
+    n = len(placement)
+    side = min(n, MAX_IMAGE_SIDE)
+    palette = np.array([[0xf0, 0xd9, 0xb5], [0xb5, 0x88, 0x63], [0, 0, 0]], dtype=np.uint8)
+    if side == n:
+        index = np.add.outer(np.arange(side), np.arange(side)) % 2
+    else:
+        index = np.zeros((side, side), dtype=np.int64)  # squares are below a pixel: plain background
+    rows = np.arange(n) * side // n
+    cols = np.asarray(placement) * side // n
+    index[rows, cols] = 2
+    fig, ax = plt.subplots(figsize=(6, 6))
+    ax.imshow(palette[index], interpolation='nearest')
+    ax.set_aspect('equal')
+    ax.axis('off')
+    return fig
 
 def draw_board(board):
-    n = len(board)
+    placement = board_to_placement(board)
+    n = len(placement)
+    if n > LARGE_BOARD:
+        return draw_board_image(placement)
     fig, ax = plt.subplots(figsize=(6, 6))
     for i in range(n):
         for j in range(n):
             color = '#f0d9b5' if (i + j) % 2 == 0 else '#b58863'  # classic chessboard colors
             rect = plt.Rectangle((j, n - i - 1), 1, 1, facecolor=color)
             ax.add_patch(rect)
-            if board[i][j] == 1:
-                ax.text(j + 0.5, n - i - 1 + 0.5, "♛", fontsize=24, ha='center', va='center', color='black')
+        ax.text(placement[i] + 0.5, n - i - 1 + 0.5, "♛", fontsize=24, ha='center', va='center', color='black')
     ax.set_xlim(0, n)
     ax.set_ylim(0, n)
     ax.set_aspect('equal')
@@ -55,7 +321,8 @@ def run_nqueens_app():
     The **N-Queens Problem** involves placing `N` queens on an `N x N` chessboard so that no two queens threaten each other.
 
     ---
-    ✅ **Solving Method**: Backtracking  
+    ✅ **Solving Method**: Bitmask Backtracking (mirror symmetry halves the search), or an
+    explicit O(N) construction / min-conflicts search for very large boards  
     📌 **Constraints**:
     - Only one queen per row and column
     - No two queens can share the same diagonal
@@ -66,16 +333,57 @@ def run_nqueens_app():
     - Wireless channel allocation
     """)
 
-    n = st.slider("🔢 Select the number of queens (N)", min_value=4, max_value=12, value=8)
+    mode = st.radio("🎯 Mode", ["Find one solution", "Count all solutions", "Show several solutions",
+                               "Large board (one placement)"], horizontal=True)
+    if mode == "Large board (one placement)":
+        n = st.number_input("🔢 Number of queens (N)", min_value=4, max_value=100000, value=1000, step=1)
+        method = st.selectbox("🧮 Method", ["Explicit construction", "Min-conflicts local search"])
+    else:
+        n = st.slider("🔢 Select the number of queens (N)", min_value=4, max_value=17, value=8)
+    workers = os.cpu_count() or 1
+    if mode == "Count all solutions" and n > 12:
+        if workers > 1:
+            workers = st.slider("⚙️ Worker processes", min_value=1, max_value=workers, value=workers)
+        st.caption("Counting runs in parallel; press **Stop** at the top right to cancel.")
 
     if st.button("🚀 Solve Now"):
-        board = solve_nqueens(n)
-        if board:
-            st.success(f"✅ Successfully placed {n} queens without conflict!")
-            fig = draw_board(board)
-            st.pyplot(fig)
+        if mode == "Count all solutions" and n <= 12:
+            total = count_nqueens(n)
+            st.success(f"✅ There are **{total:,}** ways to place {n} queens without conflict!")
+        elif mode == "Count all solutions":
+            progress = st.progress(0.0)
+            status = st.empty()
+            total = 0
+            for done, tasks, total in count_nqueens_parallel(n, workers):
+                progress.progress(done / tasks)
+                status.markdown(f"⏳ {done}/{tasks} subproblems done — **{total:,}** solutions so far")
+            status.empty()
+            st.success(f"✅ There are **{total:,}** ways to place {n} queens without conflict!")
+        elif mode == "Large board (one placement)":
+            placement = solve_nqueens_placement(
+                n, "min-conflicts" if method == "Min-conflicts local search" else "construct")
+            if placement is not None and is_valid_placement(placement):
+                st.success(f"✅ Successfully placed {n:,} queens without conflict!")
+                st.pyplot(draw_board(placement))
+                st.caption(f"Columns by row (first 20): `{placement[:20]}`")
+            else:
+                st.error("❌ Local search did not converge. Try the explicit construction.")
+        elif mode == "Show several solutions":
+            shown = 0
+            for placement in islice(nqueens_placements(n), 6):
+                shown += 1
+                st.markdown(f"**Solution {shown}** — columns by row: `{placement}`")
+                st.pyplot(draw_board(placement))
+            if not shown:
+                st.error("❌ No solution exists for this configuration.")
         else:
-            st.error("❌ No solution exists for this configuration.")
+            board = solve_nqueens(n)
+            if board:
+                st.success(f"✅ Successfully placed {n} queens without conflict!")
+                fig = draw_board(board)
+                st.pyplot(fig)
+            else:
+                st.error("❌ No solution exists for this configuration.")
 
     st.markdown("---")
     st.caption("💡 Try different values of N to explore multiple board sizes!")
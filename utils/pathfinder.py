@@ -1,15 +1,72 @@
 import streamlit as st
+import hashlib
+import heapq
+import io
+import threading
+import time
+from array import array
+from collections import OrderedDict, deque
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.animation import FuncAnimation
-
-# DFS with path exploration steps recorded for animation
+from PIL import Image
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components, dijkstra
+
+# Exploration traces are event logs: an int32 array of (op, cell) rows with the
+# cell flattened as row * cols + col. PUSH adds a cell to the current path (and
+# marks it explored), POP removes the last path cell, VISIT only marks a cell
+# explored. Frames are rebuilt by replaying, so the trace grows linearly with
+# the number of explored cells instead of storing a path copy per step.
+TRACE_PUSH, TRACE_POP, TRACE_VISIT = 0, 1, 2
+
+def _trace_array(events):
+    return np.frombuffer(events, dtype=np.int32).reshape(-1, 2)
+
+# Yield (explored, path) after every `every` events and after the last one.
+# Both are live lists of (row, col) that the next step mutates; copy to keep them.
+def replay_trace(trace, cols, every=1):
+    explored, path = [], []
+    last = len(trace) - 1
+    for idx, (op, cell) in enumerate(zip(trace[:, 0].tolist(), trace[:, 1].tolist())):
+        pos = (cell // cols, cell % cols)
+        if op == TRACE_PUSH:
+            explored.append(pos)
+            path.append(pos)
+        elif op == TRACE_POP:
+            path.pop()
+        else:
+            explored.append(pos)
+        if idx % every == every - 1 or idx == last:
+            yield explored, path
+
+# Rebuild a single frame on demand (negative indices count from the end)
+def trace_frame(trace, cols, frame):
+    if frame < 0:
+        frame += len(trace)
+    explored, path = [], []
+    for explored, path in replay_trace(trace[:frame + 1], cols):
+        pass
+    return list(explored), list(path)
+
+def trace_final_path(trace, cols):
+    return trace_frame(trace, cols, -1)[1] if len(trace) else []
+
+# Event log for an engine result: one VISIT per expanded cell, then the path pushed
+def expansion_trace(order, path, cols):
+    events = np.empty((len(order) + len(path), 2), dtype=np.int32)
+    events[:len(order), 0] = TRACE_VISIT
+    events[:len(order), 1] = order
+    events[len(order):, 0] = TRACE_PUSH
+    events[len(order):, 1] = [x * cols + y for x, y in path]
+    return events
+
+# DFS with path exploration recorded as a push/pop event log for animation
 def dfs_animated(grid, start, end):
     rows, cols = grid.shape
     visited = set()
-    path = []
-    steps = []  # To record explored cells at each recursion step
+    events = array('i')  # To record (op, cell) pairs at each recursion step
 
     def dfs_util(x, y):
         if not (0 <= x < rows and 0 <= y < cols):
@@ -18,8 +75,7 @@ def dfs_animated(grid, start, end):
             return False
 
         visited.add((x, y))
-        path.append((x, y))
-        steps.append(list(path))  # Record current path for animation
+        events.extend((TRACE_PUSH, x * cols + y))  # Record path extension for animation
 
         if (x, y) == end:
             return True
@@ -30,12 +86,237 @@ def dfs_animated(grid, start, end):
             if dfs_util(nx, ny):
                 return True
 
-        path.pop()
-        steps.append(list(path))  # Record backtrack step
+        events.extend((TRACE_POP, x * cols + y))  # Record backtrack step
         return False
 
     found = dfs_util(*start)
-    return found, steps
+    return found, _trace_array(events)
+
+# Search engines over the flattened grid: cell = row * cols + col. Parent and
+# distance arrays are preallocated NumPy arrays, accessed through memoryviews in
+# the inner loops. Each engine returns (path, trace): the path as (row, col)
+# tuples (empty when unreachable) and the expansion order as an int32 array of cells.
+def _flat_neighbors(cell, rows, cols):
+    # Same up/down/left/right order as dfs_animated
+    if cell >= cols:
+        yield cell - cols
+    if cell < (rows - 1) * cols:
+        yield cell + cols
+    if cell % cols:
+        yield cell - 1
+    if (cell + 1) % cols:
+        yield cell + 1
+
+def _search_arrays(grid):
+    rows, cols = grid.shape
+    walls = np.ascontiguousarray(grid, dtype=np.uint8).ravel()
+    parent = np.full(rows * cols, -1, dtype=np.int32)
+    dist = np.full(rows * cols, -1, dtype=np.int32)
+    return rows, cols, memoryview(walls), parent, dist
+
+def _walk_parents(parent, cell, cols):
+    path = []
+    while cell != -1:
+        path.append((cell // cols, cell % cols))
+        cell = parent[cell]
+    path.reverse()
+    return path
+
+def bfs_search(grid, start, end):
+    rows, cols, walls, parent_arr, dist_arr = _search_arrays(grid)
+    parent, dist = memoryview(parent_arr), memoryview(dist_arr)
+    source, target = start[0] * cols + start[1], end[0] * cols + end[1]
+    dist[source] = 0
+    queue = deque([source])
+    trace = []
+    while queue:
+        cell = queue.popleft()
+        trace.append(cell)
+        if cell == target:
+            return _walk_parents(parent, target, cols), np.array(trace, dtype=np.int32)
+        for nxt in _flat_neighbors(cell, rows, cols):
+            if dist[nxt] == -1 and not walls[nxt]:
+                dist[nxt] = dist[cell] + 1
+                parent[nxt] = cell
+                queue.append(nxt)
+    return [], np.array(trace, dtype=np.int32)
+
+def astar_search(grid, start, end):
+    rows, cols, walls, parent_arr, dist_arr = _search_arrays(grid)
+    parent, dist = memoryview(parent_arr), memoryview(dist_arr)
+    closed = bytearray(rows * cols)
+    source, target = start[0] * cols + start[1], end[0] * cols + end[1]
+    ex, ey = end
+    dist[source] = 0
+    queue = [(abs(start[0] - ex) + abs(start[1] - ey), 0, source)]
+    trace = []
+    while queue:
+        _, neg_g, cell = heapq.heappop(queue)
+        if closed[cell]:
+            continue
+        g = -neg_g
+        closed[cell] = 1
+        trace.append(cell)
+        if cell == target:
+            return _walk_parents(parent, target, cols), np.array(trace, dtype=np.int32)
+        for nxt in _flat_neighbors(cell, rows, cols):
+            if walls[nxt] or closed[nxt]:
+                continue
+            if dist[nxt] == -1 or g + 1 < dist[nxt]:
+                dist[nxt] = g + 1
+                parent[nxt] = cell
+                h = abs(nxt // cols - ex) + abs(nxt % cols - ey)
+                # Ties on f go to the cell closer to the goal
+                heapq.heappush(queue, (g + 1 + h, -(g + 1), nxt))
+    return [], np.array(trace, dtype=np.int32)
+
+# Bidirectional BFS: grow whichever frontier is smaller by one full layer. Once
+# the searches touch, the rest of that layer is still scanned so the shortest
+# of the joins found is used, then the two half paths are glued together.
+def bidirectional_search(grid, start, end):
+    rows, cols, walls, parent_arr, dist_arr = _search_arrays(grid)
+    parent_back_arr = np.full(rows * cols, -1, dtype=np.int32)
+    side_arr = np.full(rows * cols, 255, dtype=np.uint8)  # 0 forward, 1 backward, 255 unseen
+    parent, parent_back = memoryview(parent_arr), memoryview(parent_back_arr)
+    dist, side = memoryview(dist_arr), memoryview(side_arr)
+    source, target = start[0] * cols + start[1], end[0] * cols + end[1]
+    if source == target:
+        return [tuple(start)], np.array([source], dtype=np.int32)
+    trace = []
+    side[source], side[target] = 0, 1
+    dist[source] = dist[target] = 0
+    frontiers = [[source], [target]]
+    parents = [parent, parent_back]
+    while frontiers[0] and frontiers[1]:
+        direction = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        links = parents[direction]
+        best = None
+        next_frontier = []
+        for cell in frontiers[direction]:
+            trace.append(cell)
+            for nxt in _flat_neighbors(cell, rows, cols):
+                if walls[nxt]:
+                    continue
+                if side[nxt] == 255:
+                    side[nxt] = direction
+                    dist[nxt] = dist[cell] + 1
+                    links[nxt] = cell
+                    next_frontier.append(nxt)
+                elif side[nxt] != direction:
+                    length = dist[cell] + 1 + dist[nxt]
+                    if best is None or length < best[0]:
+                        best = (length, cell, nxt) if direction == 0 else (length, nxt, cell)
+        if best is not None:
+            _, forward_end, backward_end = best
+            path = _walk_parents(parent, forward_end, cols)
+            path += _walk_parents(parent_back, backward_end, cols)[::-1]
+            return path, np.array(trace, dtype=np.int32)
+        frontiers[direction] = next_frontier
+    return [], np.array(trace, dtype=np.int32)
+
+# Multi-query path service: grids are keyed by a hash of their contents. Per grid
+# it caches the cell adjacency graph and a connected-component labelling (so
+# queries across components fail instantly), and per (grid, target) a BFS
+# distance field. A path from any start is then read off the field by stepping
+# to a neighbour one closer to the target each time, in O(path length).
+MAX_CACHED_GRIDS = 8
+MAX_CACHED_FIELDS = 16
+_grid_cache = OrderedDict()   # key -> (graph, labels)
+_field_cache = OrderedDict()  # (key, target cell) -> int32 distances, -1 = unreachable
+_cache_lock = threading.Lock()  # Streamlit runs each session's script in its own thread
+
+def grid_key(grid):
+    grid = np.ascontiguousarray(grid, dtype=np.uint8)
+    digest = hashlib.blake2b(grid.tobytes(), digest_size=16)
+    digest.update(np.asarray(grid.shape, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+# Builds run outside the lock, so a slow build never blocks other sessions' hits;
+# two sessions missing the same key at once both build and the later one wins.
+def _lru_lookup(cache, key, build, limit):
+    with _cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    value = build()
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+    return value
+
+def _build_grid_graph(grid):
+    rows, cols = grid.shape
+    open_cells = (np.asarray(grid) == 0).ravel()
+    cells = np.arange(rows * cols)
+    right = cells[cells % cols < cols - 1]
+    right = right[open_cells[right] & open_cells[right + 1]]
+    down = cells[:-cols] if rows > 1 else cells[:0]
+    down = down[open_cells[down] & open_cells[down + cols]]
+    src = np.concatenate([right, down])
+    dst = np.concatenate([right + 1, down + cols])
+    graph = csr_matrix((np.ones(len(src), dtype=np.int8), (src, dst)), shape=(rows * cols, rows * cols))
+    _, labels = connected_components(graph, directed=False)
+    labels[~open_cells] = -1
+    return graph, labels
+
+def grid_components(grid, key=None):
+    key = key or grid_key(grid)
+    return _lru_lookup(_grid_cache, key, lambda: _build_grid_graph(grid), MAX_CACHED_GRIDS)
+
+def distance_field(grid, target, key=None):
+    key = key or grid_key(grid)
+    graph, _ = grid_components(grid, key)
+    cell = target[0] * grid.shape[1] + target[1]
+
+    def build():
+        dist = dijkstra(graph, directed=False, indices=cell, unweighted=True)
+        return np.where(np.isinf(dist), -1, dist).astype(np.int32)
+
+    return _lru_lookup(_field_cache, (key, cell), build, MAX_CACHED_FIELDS)
+
+def descend_field(field, start, cols):
+    dist = memoryview(field)
+    size = len(field)
+    cell = start[0] * cols + start[1]
+    d = dist[cell]
+    if d < 0:
+        return []
+    path = [divmod(cell, cols)]
+    while d > 0:
+        d -= 1
+        # Some neighbour is exactly one step closer; the last option is the right one
+        if cell >= cols and dist[cell - cols] == d:
+            cell -= cols
+        elif cell + cols < size and dist[cell + cols] == d:
+            cell += cols
+        elif cell % cols and dist[cell - 1] == d:
+            cell -= 1
+        else:
+            cell += 1
+        path.append(divmod(cell, cols))
+    return path
+
+def query_path(grid, start, end, key=None):
+    key = key or grid_key(grid)
+    _, labels = grid_components(grid, key)
+    cols = grid.shape[1]
+    a, b = labels[start[0] * cols + start[1]], labels[end[0] * cols + end[1]]
+    if a < 0 or a != b:
+        return []
+    return descend_field(distance_field(grid, end, key), start, cols)
+
+# Engine adapter: the field is built once per target, so there is no expansion trace
+def field_search(grid, start, end):
+    return query_path(grid, start, end), np.empty(0, dtype=np.int32)
+
+SEARCH_ENGINES = {
+    "BFS (shortest path)": bfs_search,
+    "A* (Manhattan heuristic)": astar_search,
+    "Bidirectional BFS": bidirectional_search,
+    "Cached distance field": field_search,
+}
 
 def draw_cell(ax, x, y, cell_type):
     # cell_type: "wall", "road", "house", "start", "end", "path"
@@ -51,7 +332,64 @@ def draw_cell(ax, x, y, cell_type):
     rect = patches.Rectangle((y, x), 1, 1, linewidth=1, edgecolor="gray", facecolor=colors[cell_type])
     ax.add_patch(rect)
 
-def display_maze_animation(grid, steps, start, end):
+# Raster renderer: frames are painted into one reusable uint8 buffer of palette
+# indices (one cell_px block per cell, last pixel row/column left as grid line).
+# Each trace event repaints just the one cell it touches, and the frames are
+# encoded once as a palette GIF, so no per-frame figure or quantization is needed.
+CELL_CODES = {"grid": 0, "wall": 1, "road": 2, "house": 3, "start": 4, "end": 5, "path": 6, "visited": 7}
+PALETTE = np.array([
+    [0x80, 0x80, 0x80],  # grid lines (gray cell edges)
+    [0x44, 0x44, 0x44],  # wall
+    [0xF0, 0xF0, 0xF0],  # road
+    [0xFF, 0xDD, 0xC1],  # house
+    [0x4C, 0xAF, 0x50],  # start
+    [0xE9, 0x1E, 0x63],  # end
+    [0x21, 0x96, 0xF3],  # path
+    [0xBB, 0xDE, 0xFB],  # visited
+], dtype=np.uint8)
+
+# Static cell codes: walls, roads and a fixed (seeded) 10% of roads drawn as houses
+def maze_base_codes(grid, start, end, seed=42):
+    codes = np.where(grid == 1, CELL_CODES["wall"], CELL_CODES["road"]).astype(np.uint8)
+    houses = (grid == 0) & (np.random.default_rng(seed).random(grid.shape) < 0.1)
+    codes[houses] = CELL_CODES["house"]
+    codes[tuple(start)] = CELL_CODES["start"]
+    codes[tuple(end)] = CELL_CODES["end"]
+    return codes
+
+def render_codes(codes, cell_px):
+    frame = np.kron(codes, np.ones((cell_px, cell_px), dtype=np.uint8))
+    frame[cell_px - 1::cell_px, :] = CELL_CODES["grid"]
+    frame[:, cell_px - 1::cell_px] = CELL_CODES["grid"]
+    return frame
+
+def _frame_image(frame):
+    img = Image.fromarray(frame.copy(), mode="P")
+    img.putpalette(PALETTE.ravel().tolist())
+    return img
+
+# Paint every `every`-th trace event (and the last) into the frame buffer and
+# return the whole animation as GIF bytes
+def render_trace_gif(grid, trace, start, end, every=1, cell_px=24, duration=200):
+    rows, cols = grid.shape
+    frame = render_codes(maze_base_codes(grid, start, end), cell_px)
+    skip = {start[0] * cols + start[1], end[0] * cols + end[1]}
+    inner = cell_px - 1
+    images = [_frame_image(frame)]
+    last = len(trace) - 1
+    for idx, (op, cell) in enumerate(zip(trace[:, 0].tolist(), trace[:, 1].tolist())):
+        if cell not in skip:
+            code = CELL_CODES["path"] if op == TRACE_PUSH else CELL_CODES["visited"]
+            x, y = (cell // cols) * cell_px, (cell % cols) * cell_px
+            frame[x:x + inner, y:y + inner] = code
+        if idx % every == every - 1 or idx == last:
+            images.append(_frame_image(frame))
+    buf = io.BytesIO()
+    # optimize=False skips palette re-optimization; frames already share one 8-colour palette
+    images[0].save(buf, format="GIF", save_all=True, append_images=images[1:], duration=duration, optimize=False)
+    return buf.getvalue()
+
+def display_maze_animation(grid, trace, start, end):
     rows, cols = grid.shape
     fig, ax = plt.subplots(figsize=(cols / 2, rows / 2))
     ax.set_xlim(0, cols)
@@ -86,7 +424,8 @@ def display_maze_animation(grid, steps, start, end):
         draw_cell(ax, *end, "end")
         return []
 
-    def update(frame):
+    def update(state):
+        visited_cells, path_cells = state
         ax.clear()
         ax.set_xlim(0, cols)
         ax.set_ylim(0, rows)
@@ -104,34 +443,218 @@ def display_maze_animation(grid, steps, start, end):
         draw_cell(ax, *start, "start")
         draw_cell(ax, *end, "end")
 
-        visited_cells = set()
-        for pos in steps[frame]:
-            visited_cells.add(pos)
-
         # Draw visited but not in current path
         for cell in visited_cells:
             if cell != start and cell != end:
                 draw_cell(ax, cell[0], cell[1], "visited")
 
-        # Draw current path (last step in steps[frame])
-        for cell in steps[frame]:
+        # Draw current path
+        for cell in path_cells:
             if cell != start and cell != end:
                 draw_cell(ax, cell[0], cell[1], "path")
 
         return []
 
-    anim = FuncAnimation(fig, update, frames=len(steps), init_func=init, interval=250, repeat=False)
+    anim = FuncAnimation(fig, update, frames=replay_trace(trace, cols), init_func=init, interval=250,
+                         repeat=False, save_count=len(trace))
 
     return anim
 
+# Large grids: loaders, generators and a downsampled still renderer. Grids are
+# uint8 arrays (1 = wall) and are solved with the iterative engines above.
+WALL_CHARS = b"1#"
+
+def load_grid(name, data):
+    ext = name.rsplit(".", 1)[-1].lower()
+    if ext == "npy":
+        grid = np.load(io.BytesIO(data), allow_pickle=False)
+        if grid.ndim != 2:
+            raise ValueError("The .npy array must be 2-D.")
+        return (grid != 0).astype(np.uint8)
+    if ext in ("png", "bmp", "gif", "jpg", "jpeg"):
+        # Dark pixels are walls
+        pixels = np.asarray(Image.open(io.BytesIO(data)).convert("L"))
+        return (pixels < 128).astype(np.uint8)
+    # Packed text: one line per row, one character per cell ('1' or '#' is a wall)
+    lines = [line.strip() for line in data.splitlines() if line.strip()]
+    if not lines or len({len(line) for line in lines}) != 1:
+        raise ValueError("Every text row must have the same number of cells.")
+    raw = np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(len(lines), -1)
+    return np.isin(raw, np.frombuffer(WALL_CHARS, dtype=np.uint8)).astype(np.uint8)
+
+# Recursive backtracker with an explicit stack: rooms sit on odd coordinates and
+# carving removes the wall between a room and an unvisited neighbour room
+def generate_backtracker_maze(rows, cols, seed=None):
+    rng = np.random.default_rng(seed)
+    grid = np.ones((rows, cols), dtype=np.uint8)
+    room_rows, room_cols = (rows - 1) // 2, (cols - 1) // 2
+    if room_rows < 1 or room_cols < 1:
+        return np.zeros((rows, cols), dtype=np.uint8)
+    seen = np.zeros((room_rows, room_cols), dtype=bool)
+    seen[0, 0] = True
+    grid[1, 1] = 0
+    stack = [(0, 0)]
+    steps = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc) for dr, dc in steps
+                   if 0 <= r + dr < room_rows and 0 <= c + dc < room_cols and not seen[r + dr, c + dc]]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = options[rng.integers(len(options))]
+        seen[nr, nc] = True
+        grid[2 * nr + 1, 2 * nc + 1] = 0
+        grid[r + nr + 1, c + nc + 1] = 0
+        stack.append((nr, nc))
+    return grid
+
+# Cellular-automaton caves: random fill, then a few vectorized smoothing passes
+# where a cell becomes a wall when at least 5 of its 8 neighbours are walls
+def generate_cave_maze(rows, cols, fill=0.45, passes=4, seed=None):
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((rows, cols)) < fill).astype(np.uint8)
+    for _ in range(passes):
+        padded = np.pad(grid, 1, constant_values=1)
+        neighbours = sum(padded[1 + dr:rows + 1 + dr, 1 + dc:cols + 1 + dc]
+                         for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc)
+        grid = ((neighbours >= 5) | ((grid == 1) & (neighbours >= 4))).astype(np.uint8)
+    return grid
+
+# Still image of a solved large grid, reduced to at most max_side pixels a side.
+# Each pixel covers a block of cells: it is a wall when most of the block is
+# wall, and any explored/path/start/end cell inside the block shows through
+# (the most important one wins), so thin paths survive downsampling.
+OVERLAY_ORDER = ["visited", "path", "start", "end"]
+
+def _block_reduce(values, factor, reducer):
+    rows, cols = values.shape
+    padded = np.zeros((-(-rows // factor) * factor, -(-cols // factor) * factor), dtype=values.dtype)
+    padded[:rows, :cols] = values
+    return reducer(padded.reshape(padded.shape[0] // factor, factor, -1, factor), axis=(1, 3))
+
+def render_grid_image(grid, start, end, path=(), explored=(), max_side=800):
+    rows, cols = grid.shape
+    overlay = np.zeros(rows * cols, dtype=np.uint8)  # 0 = nothing, else 1 + OVERLAY_ORDER index
+    if len(explored):
+        overlay[np.asarray(explored)] = 1 + OVERLAY_ORDER.index("visited")
+    overlay = overlay.reshape(rows, cols)
+    if len(path):
+        cells = np.asarray(path)
+        overlay[cells[:, 0], cells[:, 1]] = 1 + OVERLAY_ORDER.index("path")
+    overlay[tuple(start)] = 1 + OVERLAY_ORDER.index("start")
+    overlay[tuple(end)] = 1 + OVERLAY_ORDER.index("end")
+    walls = grid == 1
+
+    factor = -(-max(rows, cols) // max_side)
+    if factor > 1:
+        walls = _block_reduce(walls.astype(np.float32), factor, np.mean) >= 0.5
+        overlay = _block_reduce(overlay, factor, np.max)
+    codes = np.array([CELL_CODES[name] for name in ["road"] + OVERLAY_ORDER], dtype=np.uint8)[overlay]
+    codes[(overlay == 0) & walls] = CELL_CODES["wall"]
+    if factor == 1:
+        scale = max(1, max_side // max(rows, cols))
+        codes = np.kron(codes, np.ones((scale, scale), dtype=np.uint8))
+    return Image.fromarray(PALETTE[codes])
+
+def run_large_maze_mode():
+    st.markdown("### 🗺️ Large Grid")
+    source = st.radio("Grid source", ["Generate a maze", "Upload a grid"], horizontal=True)
+
+    if source == "Generate a maze":
+        c1, c2, c3 = st.columns(3)
+        rows = c1.number_input("Rows", min_value=5, max_value=4000, value=301)
+        cols = c2.number_input("Columns", min_value=5, max_value=4000, value=301)
+        seed = c3.number_input("Seed", min_value=0, value=0)
+        generator = st.selectbox("Generator", ["Recursive backtracker", "Cellular automaton caves"])
+        if st.button("🎲 Generate"):
+            if generator == "Recursive backtracker":
+                st.session_state["large_grid"] = generate_backtracker_maze(rows, cols, seed)
+            else:
+                st.session_state["large_grid"] = generate_cave_maze(rows, cols, seed=seed)
+    else:
+        st.caption("Accepted: `.npy` (non-zero = wall), PNG/BMP bitmaps (dark = wall), "
+                   "or text with one character per cell (`1`/`#` = wall).")
+        upload = st.file_uploader("Grid file", type=["npy", "png", "bmp", "gif", "jpg", "jpeg", "txt"])
+        if upload is not None:
+            try:
+                st.session_state["large_grid"] = load_grid(upload.name, upload.getvalue())
+            except Exception as e:
+                st.error(f"⚠️ Could not read the grid: {e}")
+                return
+
+    grid = st.session_state.get("large_grid")
+    if grid is None:
+        st.info("Generate or upload a grid to continue.")
+        return
+
+    rows, cols = grid.shape
+    open_cells = np.flatnonzero(grid.ravel() == 0)
+    if len(open_cells) == 0:
+        st.error("⚠️ The grid has no open cells.")
+        return
+    st.caption(f"Grid: {rows} × {cols} ({len(open_cells):,} open cells)")
+
+    first, last = divmod(int(open_cells[0]), cols), divmod(int(open_cells[-1]), cols)
+    engine = st.selectbox("🧠 Search Algorithm", list(SEARCH_ENGINES), key="large_engine")
+    start = st.text_input("🚩 Start Position (row,col)", value=f"{first[0]},{first[1]}", key="large_start")
+    end = st.text_input("🏁 End Position (row,col)", value=f"{last[0]},{last[1]}", key="large_end")
+
+    if st.button("🔍 Find Path", key="large_solve"):
+        try:
+            sx, sy = map(int, start.strip().split(","))
+            ex, ey = map(int, end.strip().split(","))
+        except ValueError:
+            st.error("⚠️ Positions must be written as row,col.")
+            return
+        if not (0 <= sx < rows and 0 <= sy < cols and 0 <= ex < rows and 0 <= ey < cols):
+            st.error("⚠️ Start or end position is out of bounds.")
+            return
+        if grid[sx, sy] == 1 or grid[ex, ey] == 1:
+            st.error("⚠️ Start or end point cannot be a wall (1).")
+            return
+
+        began = time.perf_counter()
+        path, order = SEARCH_ENGINES[engine](grid, (sx, sy), (ex, ey))
+        elapsed = time.perf_counter() - began
+        if path:
+            st.success(f"✅ Path found with {len(path):,} steps in {elapsed:.2f}s "
+                       f"({len(order):,} cells explored)")
+        else:
+            st.error(f"🚫 No path found ({len(order):,} cells explored in {elapsed:.2f}s).")
+        st.image(render_grid_image(grid, (sx, sy), (ex, ey), path, order))
+
+    with st.expander("📋 Batch queries on this grid (cached distance fields)"):
+        st.caption("One query per line as `row,col -> row,col`. Repeated targets reuse the cached field.")
+        text = st.text_area("Queries", value=f"{start} -> {end}", key="large_queries")
+        if st.button("⚡ Run Queries", key="large_run_queries"):
+            key = grid_key(grid)
+            results = []
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    a, b = (tuple(map(int, part.strip().split(","))) for part in line.split("->"))
+                    if not all(0 <= p[0] < rows and 0 <= p[1] < cols for p in (a, b)):
+                        raise ValueError("out of bounds")
+                except ValueError:
+                    results.append({"query": line.strip(), "steps": None, "ms": None, "note": "invalid"})
+                    continue
+                began = time.perf_counter()
+                path = query_path(grid, a, b, key)
+                results.append({"query": line.strip(), "steps": len(path) or None,
+                                "ms": round((time.perf_counter() - began) * 1000, 2),
+                                "note": "" if path else "no path"})
+            st.table(results)
+
 # Streamlit App
 def run_pathfinder_app():
-    st.set_page_config(page_title="DFS Maze Pathfinder", layout="centered")
-    st.title("🧭 Maze Pathfinding using DFS")
+    st.set_page_config(page_title="Maze Pathfinder", layout="centered")
+    st.title("🧭 Maze Pathfinding")
 
     st.markdown("""
     This tool visualizes the path from a **start** to an **end** point in a grid-based maze using  
-    **Depth-First Search (DFS)** algorithm with animation.
+    **Depth-First Search (DFS)**, **BFS**, **A\\*** or **Bidirectional BFS** with animation.
     
     ---
 
@@ -141,6 +664,12 @@ def run_pathfinder_app():
     - 🌐 Network routing
     """)
 
+    mode = st.radio("📐 Grid Size", ["Small grid (draw & animate)", "Large grid (upload / generate)"],
+                    horizontal=True)
+    if mode == "Large grid (upload / generate)":
+        run_large_maze_mode()
+        return
+
     rows = st.slider("🔢 Number of Rows", 5, 20, 10)
     cols = st.slider("🔢 Number of Columns", 5, 20, 10)
 
@@ -161,6 +690,8 @@ def run_pathfinder_app():
             st.error(f"❌ Invalid entry in Row {i+1}. Use 0 or 1 only.")
             return
 
+    engine = st.selectbox("🧠 Search Algorithm", ["DFS (animated backtracking)"] + list(SEARCH_ENGINES))
+
     start = st.text_input("🚩 Start Position (row,col)", value="0,0")
     end = st.text_input("🏁 End Position (row,col)", value=f"{rows-1},{cols-1}")
 
@@ -176,60 +707,21 @@ def run_pathfinder_app():
                 st.error("⚠️ Start or end point cannot be a wall (1).")
                 return
 
-            found, steps = dfs_animated(grid, (sx, sy), (ex, ey))
+            if engine in SEARCH_ENGINES:
+                path, order = SEARCH_ENGINES[engine](grid, (sx, sy), (ex, ey))
+                found = bool(path)
+                trace = expansion_trace(order, path, cols)
+                every = max(1, -(-len(order) // 60))  # Reveal the expansion in about 60 frames
+            else:
+                found, trace = dfs_animated(grid, (sx, sy), (ex, ey))
+                path = trace_final_path(trace, cols)
+                every = 1
             if found:
-                st.success(f"✅ Path found with {len(steps[-1])} steps!")
-
-                # Animate inside Streamlit
-                # Unfortunately, Streamlit cannot display matplotlib FuncAnimation directly
-                # So, save frames as images and show them one by one in Streamlit
-
-                # Convert each frame to an image
-                import io
-                from PIL import Image
-
-                images = []
-                for frame in range(len(steps)):
-                    fig, ax = plt.subplots(figsize=(cols / 2, rows / 2))
-                    ax.set_xlim(0, cols)
-                    ax.set_ylim(0, rows)
-                    ax.set_aspect('equal')
-                    ax.axis('off')
-
-                    for i in range(rows):
-                        for j in range(cols):
-                            if grid[i][j] == 1:
-                                draw_cell(ax, i, j, "wall")
-                            elif np.random.rand() < 0.1:  # random houses
-                                draw_cell(ax, i, j, "house")
-                            else:
-                                draw_cell(ax, i, j, "road")
-
-                    draw_cell(ax, sx, sy, "start")
-                    draw_cell(ax, ex, ey, "end")
-
-                    visited_cells = set(steps[frame])
-                    for cell in visited_cells:
-                        if cell != (sx, sy) and cell != (ex, ey):
-                            draw_cell(ax, cell[0], cell[1], "visited")
-
-                    for cell in steps[frame]:
-                        if cell != (sx, sy) and cell != (ex, ey):
-                            draw_cell(ax, cell[0], cell[1], "path")
-
-                    buf = io.BytesIO()
-                    plt.savefig(buf, format='png')
-                    plt.close(fig)
-                    buf.seek(0)
-                    img = Image.open(buf)
-                    images.append(img)
-
-                # Show animation by cycling images
-                import time
-                placeholder = st.empty()
-                for img in images:
-                    placeholder.image(img)
-                    time.sleep(0.2)
+                st.success(f"✅ Path found with {len(path)} steps!")
+
+                # Streamlit cannot display matplotlib FuncAnimation directly, so the
+                # frames are rasterized and handed over as a single animated GIF
+                st.image(render_trace_gif(grid, trace, (sx, sy), (ex, ey), every))
             else:
                 st.error("🚫 No path found. Try changing the wall configuration.")
         except Exception as e:
@@ -1,5 +1,12 @@
 import streamlit as st
 import heapq
+import argparse
+import os
+import random
+import sys
+import tempfile
+from collections import deque
+from functools import lru_cache
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.animation import FuncAnimation
@@ -43,8 +50,324 @@ def get_neighbors(state):
 def same(s1, s2):
     return all(s1[i][j] == s2[i][j] for i in range(3) for j in range(3))
 
+# Packed state layout: one 4-bit nibble per cell, cell 0 in the most significant
+# nibble, so comparing packed ints orders states the same way as comparing boards
+SHIFTS = [4 * (8 - idx) for idx in range(9)]
+
+# Cells the blank can swap with, in the same up/down/left/right order as get_neighbors
+BLANK_MOVES = [
+    [(x + dx) * 3 + (y + dy) for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+     if 0 <= x + dx < 3 and 0 <= y + dy < 3]
+    for x in range(3) for y in range(3)
+]
+
+# Manhattan distance of each tile from each cell (tile 0 contributes nothing)
+TILE_DIST = [
+    [0] * 9 if tile == 0 else
+    [abs((tile - 1) // 3 - pos // 3) + abs((tile - 1) % 3 - pos % 3) for pos in range(9)]
+    for tile in range(9)
+]
+
+def pack_state(state):
+    packed = 0
+    for idx, val in enumerate(v for row in state for v in row):
+        packed |= val << SHIFTS[idx]
+    return packed
+
+def unpack_state(packed):
+    flat = [(packed >> shift) & 0xF for shift in SHIFTS]
+    return [flat[0:3], flat[3:6], flat[6:9]]
+
+def packed_blank(packed):
+    for idx, shift in enumerate(SHIFTS):
+        if (packed >> shift) & 0xF == 0:
+            return idx
+
+def packed_manhattan(packed):
+    return sum(TILE_DIST[(packed >> shift) & 0xF][idx] for idx, shift in enumerate(SHIFTS))
+
+GOAL_PACKED = pack_state(goal_state)
+
+# Solvability: on a 3x3 board a state is reachable from the goal only when the
+# tiles (ignoring the blank) have an even number of inversions
+def is_solvable(state):
+    flat = [v for row in state for v in row if v != 0]
+    inversions = sum(1 for i in range(len(flat)) for j in range(i + 1, len(flat)) if flat[i] > flat[j])
+    return inversions % 2 == 0
+
+# Additive pattern database: tiles 1-4 and 5-8 each get a table indexed by the
+# cells of their tiles plus the blank (base-9 digits). An entry holds the fewest
+# moves of that pattern's tiles needed to put them home, so the two sums never
+# overestimate and dominate Manhattan distance.
+PDB_PATTERNS = [(1, 2, 3, 4), (5, 6, 7, 8)]
+PDB_SIZE = 9 ** 5
+PDB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "puzzle8_pdb.npy")
+
+# Both pattern indices live in one int key (pattern 0 in the low base-PDB_SIZE digit)
+# so a move updates the key with a single addition
+PDB_TILE_WEIGHT = [0] * 9
+for _p, _tiles in enumerate(PDB_PATTERNS):
+    for _k, _tile in enumerate(_tiles):
+        PDB_TILE_WEIGHT[_tile] = 9 ** _k * PDB_SIZE ** _p
+PDB_BLANK_WEIGHT = 9 ** 4 * (1 + PDB_SIZE)
+
+def pattern_key(packed):
+    key = 0
+    for idx, shift in enumerate(SHIFTS):
+        tile = (packed >> shift) & 0xF
+        key += idx * (PDB_BLANK_WEIGHT if tile == 0 else PDB_TILE_WEIGHT[tile])
+    return key
+
+# Write a table next to `path` and rename it into place, so a session loading it
+# never sees a half-written file; returns False when the directory is not writable
+# (callers then keep the table in memory)
+def save_table(path, array):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, array)
+        os.replace(temp_path, path)
+    except OSError:
+        os.unlink(temp_path)
+        return False
+    return True
+
+# Builds the tables and saves them to `path` when it is writable (None: don't save)
+def build_pattern_database(path=PDB_PATH):
+    tables = np.full((len(PDB_PATTERNS), PDB_SIZE), 255, dtype=np.uint8)
+    for p, tiles in enumerate(PDB_PATTERNS):
+        # 0-1 BFS backwards from the goal: sliding a pattern tile costs 1, any other tile 0
+        goal_cells = tuple(tile - 1 for tile in tiles) + (8,)
+        dist = {goal_cells: 0}
+        queue = deque([goal_cells])
+        while queue:
+            cells = queue.popleft()
+            d = dist[cells]
+            blank = cells[-1]
+            for pos in BLANK_MOVES[blank]:
+                moved = list(cells)
+                moved[-1] = pos
+                cost = 0
+                if pos in cells[:-1]:
+                    moved[cells.index(pos)] = blank
+                    cost = 1
+                moved = tuple(moved)
+                if d + cost < dist.get(moved, 255):
+                    dist[moved] = d + cost
+                    if cost:
+                        queue.append(moved)
+                    else:
+                        queue.appendleft(moved)
+        for cells, d in dist.items():
+            tables[p, sum(cell * 9 ** k for k, cell in enumerate(cells))] = d
+    if path is not None:
+        save_table(path, tables)
+    return tables
+
+# Memory-map the pattern database once per process; a missing or unreadable file
+# is rebuilt, and used from memory if it cannot be saved
+@lru_cache(maxsize=None)
+def load_pattern_database(path=PDB_PATH):
+    try:
+        tables = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        tables = build_pattern_database(path)
+    return tuple(memoryview(tables[p]) for p in range(len(PDB_PATTERNS)))
+
+def pattern_heuristic(key, tables):
+    return tables[0][key % PDB_SIZE] + tables[1][key // PDB_SIZE]
+
+# A path packed into one int: every state after the start in STATE_BITS bits,
+# the first move in the highest bits
+STATE_BITS = 36
+STATE_MASK = (1 << STATE_BITS) - 1
+
+def unpack_path(start, packed_path, moves):
+    return [start] + [(packed_path >> (STATE_BITS * k)) & STATE_MASK for k in range(moves - 1, -1, -1)]
+
+# A* over packed states: the blank position is carried with each state and the
+# Manhattan estimate is updated per move from the single tile that slides.
+# Each discovered state keeps its best path packed into one int (unpack_path),
+# which is both the parent link and the tie-break: equal-length packed paths
+# compare in the same order as the state lists themselves, so an equal-cost tie
+# is a single int comparison. A state's path can only change before it is
+# expanded, so the paths its children extend are final.
+# heuristic="pdb" swaps Manhattan for the pattern database, tracked by an int key.
+def solve_packed(start, stats=None, heuristic="manhattan"):
+    if not is_solvable(start):
+        if stats is not None:
+            stats.update(peak_frontier=0, closed=0, discovered=0)
+        return []
+
+    start_packed = pack_state(start)
+    tables = load_pattern_database() if heuristic == "pdb" else None
+    if tables is None:
+        start_key, start_h = 0, packed_manhattan(start_packed)
+    else:
+        start_key = pattern_key(start_packed)
+        start_h = pattern_heuristic(start_key, tables)
+    queue = [(start_h, 0, start_packed, packed_blank(start_packed), start_key)]
+    paths = {start_packed: 0}
+    best_cost = {start_packed: 0}
+    visited = set()
+    peak_frontier = 1
+    path = []
+
+    while queue:
+        est_total, cost, state, blank, key = heapq.heappop(queue)
+        if state in visited:
+            continue
+        visited.add(state)
+
+        if state == GOAL_PACKED:
+            path = unpack_path(start_packed, paths[state], cost)
+            break
+
+        h = est_total - cost
+        blank_shift = SHIFTS[blank]
+        prefix = paths[state] << STATE_BITS
+        for pos in BLANK_MOVES[blank]:
+            tile = (state >> SHIFTS[pos]) & 0xF
+            neighbor = state - (tile << SHIFTS[pos]) + (tile << blank_shift)
+            if neighbor in visited:
+                continue
+            known = best_cost.get(neighbor)
+            if known is None or cost + 1 < known:
+                best_cost[neighbor] = cost + 1
+                paths[neighbor] = prefix | neighbor
+                if tables is None:
+                    new_key = 0
+                    new_h = h - TILE_DIST[tile][pos] + TILE_DIST[tile][blank]
+                else:
+                    new_key = key + (blank - pos) * (PDB_TILE_WEIGHT[tile] - PDB_BLANK_WEIGHT)
+                    new_h = pattern_heuristic(new_key, tables)
+                heapq.heappush(queue, (cost + 1 + new_h, cost + 1, neighbor, pos, new_key))
+            elif known == cost + 1 and prefix | neighbor < paths[neighbor]:
+                # Equal-cost tie: keep the smaller path, as comparing full paths in the heap did
+                paths[neighbor] = prefix | neighbor
+        peak_frontier = max(peak_frontier, len(queue))
+
+    if stats is not None:
+        stats["peak_frontier"] = peak_frontier
+        stats["closed"] = len(visited)
+        stats["discovered"] = len(paths)
+    return path
+
+# Perfect lookup table: every solvable state gets a rank in 0..9!/2-1 as
+# blank cell * 8!/2 + Lehmer rank of the tile order halved. The halving drops the
+# second-to-last Lehmer digit, which is fixed by the even inversion parity.
+HALF_FACTORIALS = [2520, 360, 60, 12, 3, 1]
+TABLE_SIZE = 9 * 20160
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "puzzle8_table.npy")
+
+# Table entries pack the distance to the goal in the low 5 bits and the best
+# blank move (index into DIRECTION_STEPS: up, down, left, right) in bits 5-6
+DIRECTION_STEPS = [-3, 3, -1, 1]
+
+def state_rank(packed):
+    tiles = []
+    blank = 0
+    for idx, shift in enumerate(SHIFTS):
+        tile = (packed >> shift) & 0xF
+        if tile == 0:
+            blank = idx
+        else:
+            tiles.append(tile)
+    rank = 0
+    for i, weight in enumerate(HALF_FACTORIALS):
+        tile = tiles[i]
+        rank += weight * sum(1 for other in tiles[i + 1:] if other < tile)
+    return blank * 20160 + rank
+
+# One backward BFS from the goal fills the distance and best move of all 181,440
+# states; saved to `path` when it is writable (None: don't save)
+def build_lookup_table(path=TABLE_PATH):
+    table = bytearray([255]) * TABLE_SIZE
+    table[state_rank(GOAL_PACKED)] = 0
+    frontier = [(GOAL_PACKED, 8)]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for state, blank in frontier:
+            for pos in BLANK_MOVES[blank]:
+                tile = (state >> SHIFTS[pos]) & 0xF
+                neighbor = state - (tile << SHIFTS[pos]) + (tile << SHIFTS[blank])
+                rank = state_rank(neighbor)
+                if table[rank] == 255:
+                    # From the neighbor, the best move sends the blank back to where it came from
+                    table[rank] = depth | (DIRECTION_STEPS.index(blank - pos) << 5)
+                    next_frontier.append((neighbor, pos))
+        frontier = next_frontier
+    table = np.frombuffer(bytes(table), dtype=np.uint8)
+    if path is not None:
+        save_table(path, table)
+    return table
+
+# Memory-map the lookup table once per process; like the pattern database, a
+# missing or unreadable file is rebuilt and kept in memory if it cannot be saved
+@lru_cache(maxsize=None)
+def load_lookup_table(path=TABLE_PATH):
+    try:
+        table = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        table = build_lookup_table(path)
+    return memoryview(table)
+
+# Table walk: follow the stored best move from each state, O(depth) with no search
+def solve_table(start):
+    if not is_solvable(start):
+        return []
+    table = load_lookup_table()
+    state = pack_state(start)
+    blank = packed_blank(state)
+    path = [state]
+    entry = table[state_rank(state)]
+    while entry & 0x1F:
+        pos = blank + DIRECTION_STEPS[entry >> 5]
+        tile = (state >> SHIFTS[pos]) & 0xF
+        state = state - (tile << SHIFTS[pos]) + (tile << SHIFTS[blank])
+        blank = pos
+        path.append(state)
+        entry = table[state_rank(state)]
+    return path
+
+def random_solvable_board(rng):
+    while True:
+        flat = list(range(9))
+        rng.shuffle(flat)
+        board = [flat[0:3], flat[3:6], flat[6:9]]
+        if is_solvable(board):
+            return board
+
+# Compare table walks against A* on random boards; returns the boards that disagree
+def verify_lookup_table(samples=200, seed=0):
+    rng = random.Random(seed)
+    mismatches = []
+    for _ in range(samples):
+        board = random_solvable_board(rng)
+        table_path = solve_table(board)
+        legal = all(
+            next_state in [pack_state(n) for n in get_neighbors(unpack_state(state))]
+            for state, next_state in zip(table_path, table_path[1:])
+        )
+        if not legal or table_path[-1] != GOAL_PACKED or len(table_path) != len(solve_packed(board, heuristic="pdb")):
+            mismatches.append(board)
+    return mismatches
+
 # A* Solver
-def solve_puzzle(start):
+# method is "manhattan" or "pdb" for A*, or "table" for the precomputed lookup table
+def solve_puzzle(start, method="manhattan"):
+    if method == "table":
+        return [unpack_state(packed) for packed in solve_table(start)]
+    return [unpack_state(packed) for packed in solve_packed(start, heuristic=method)]
+
+# Original list-of-lists A*, kept as a reference for benchmarks
+def solve_puzzle_lists(start):
     queue = [(manhattan(start), 0, start, [])]
     visited = set()
 
@@ -95,7 +418,8 @@ def run_8puzzle_app():
     st.title("🧩 8-Puzzle Solver")
     st.markdown("""
     A real-time solver for the 8-tile sliding puzzle using **A\\*** Search algorithm.  
-    **Heuristic:** Manhattan Distance  
+    **Heuristic:** Manhattan Distance or an additive Pattern Database, or skip the search
+    with a precomputed table of every solvable state  
     Try rearranging the puzzle to see the solution path.
     ---
     """)
@@ -121,9 +445,16 @@ def run_8puzzle_app():
         st.error("⚠️ Puzzle must contain unique numbers from 0 to 8.")
         return
 
+    methods = {"Manhattan Distance": "manhattan", "Pattern Database": "pdb", "Lookup Table (no search)": "table"}
+    method = st.radio("📐 Heuristic", list(methods), horizontal=True)
+
     if st.button("🧠 Solve Puzzle"):
+        if not is_solvable(user_input):
+            st.error("🚫 This configuration is unsolvable (odd number of tile inversions).")
+            return
+
         with st.spinner("Solving..."):
-            solution = solve_puzzle(user_input)
+            solution = solve_puzzle(user_input, methods[method])
 
         if not solution:
             st.error("🚫 No solution found. Try a different configuration.")
@@ -142,5 +473,40 @@ def run_8puzzle_app():
                 fig = draw_puzzle(state)
                 st.pyplot(fig)
 
+# Command line: build the precomputed tables or check the lookup table against A*
+#   python -m utils.puzzle8 build-table
+#   python -m utils.puzzle8 verify-table --samples 500
+def puzzle8_cli(argv):
+    parser = argparse.ArgumentParser(prog="python -m utils.puzzle8")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("build-table", help="build the 9!/2 distance/move lookup table")
+    commands.add_parser("build-pdb", help="build the additive pattern database")
+    verify = commands.add_parser("verify-table", help="compare lookup table answers with A*")
+    verify.add_argument("--samples", type=int, default=200)
+    verify.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "build-table":
+        table = build_lookup_table(None)
+        if not save_table(TABLE_PATH, table):
+            print(f"Could not write {TABLE_PATH}")
+            return 1
+        print(f"Wrote {TABLE_PATH} ({table.nbytes} bytes, max depth {int((np.asarray(table) & 0x1F).max())})")
+    elif args.command == "build-pdb":
+        tables = build_pattern_database(None)
+        if not save_table(PDB_PATH, tables):
+            print(f"Could not write {PDB_PATH}")
+            return 1
+        print(f"Wrote {PDB_PATH} ({tables.nbytes} bytes)")
+    else:
+        mismatches = verify_lookup_table(args.samples, args.seed)
+        print(f"{args.samples - len(mismatches)}/{args.samples} boards match A*")
+        for board in mismatches:
+            print(f"  mismatch: {board}")
+        return 1 if mismatches else 0
+    return 0
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(puzzle8_cli(sys.argv[1:]))
     run_8puzzle_app()
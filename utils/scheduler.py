@@ -2,33 +2,310 @@
 
 import streamlit as st
 import matplotlib.pyplot as plt
+import numpy as np
+import random
+from sortedcontainers import SortedList
 
-def schedule_tasks(tasks):
-    tasks.sort(key=lambda x: x[1])  # Sort by end time
+# Greedy by earliest end time; returns the indices of the chosen tasks in end-time
+# order, so identical tasks stay distinct
+def schedule_task_indices(tasks):
     selected = []
     last_end_time = 0
 
-    for start, end in tasks:
+    for i in sorted(range(len(tasks)), key=lambda i: tasks[i][1]):  # Sort by end time, leaving the caller's list alone
+        start, end = tasks[i]
         if start >= last_end_time:
-            selected.append((start, end))
+            selected.append(i)
             last_end_time = end
     return selected
 
-def plot_schedule(tasks, selected):
-    fig, ax = plt.subplots(figsize=(10, 2))
-    y = 0.5
-    height = 0.3
+def schedule_tasks(tasks):
+    return [tasks[i] for i in schedule_task_indices(tasks)]
+
+# Weighted interval scheduling: tasks sorted by end time, and p[i] (how many tasks
+# end by the time task i starts) is the bisect_right of every start at once via
+# np.searchsorted. The DP itself is one pass over Python lists; a task is taken only
+# when strictly better, so ties keep the earlier-ending tasks. Intervals are
+# half-open, a task may start exactly when another ends.
+# Returns (total_weight, indices of the chosen tasks in end-time order).
+def weighted_interval_schedule(starts, ends, weights):
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    order = np.argsort(ends)
+    sorted_ends = ends[order]
+    previous = np.searchsorted(sorted_ends, starts[order], side='right').tolist()
+    w = weights[order].tolist()
+
+    n = len(w)
+    best = [0.0] * (n + 1)
+    take = bytearray(n)
+    for i in range(n):
+        with_task = w[i] + best[previous[i]]
+        if with_task > best[i]:
+            best[i + 1] = with_task
+            take[i] = 1
+        else:
+            best[i + 1] = best[i]
+
+    chosen = []
+    i = n
+    while i > 0:
+        if take[i - 1]:
+            chosen.append(i - 1)
+            i = previous[i - 1]
+        else:
+            i -= 1
+    return best[n], order[np.array(chosen[::-1], dtype=np.int64)]
+
+# Fewest machines (interval partitioning). The classic sweep keeps a heap of busy
+# machines keyed by end time; here the order the heap would release machines in is
+# just the end times sorted, so the sweep is done with sorts instead of a heap.
+# r[k] = how many tasks have ended by the k-th start, and a[k] = how many freed
+# machines were reused before it follows a[k+1] = min(a[k] + 1, r[k]), which is a
+# running minimum. Task k reuses the machine of the a[k]-th task to end (FIFO)
+# when r[k] > a[k], otherwise it opens a new machine; the chains of reuse are
+# resolved by pointer jumping. Returns (machine_count, machine index per task).
+def assign_machines(starts, ends):
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    n = len(starts)
+    if n == 0:
+        return 0, np.zeros(0, dtype=np.int64)
+    start_order = np.argsort(starts)
+    end_order = np.argsort(ends)
+    released = np.searchsorted(ends[end_order], starts[start_order], side='right')
+
+    k = np.arange(n)
+    reused = np.minimum.accumulate(np.concatenate(([0], released[:-1] - k[:-1] - 1))) + k
+    reuse = released > reused
+    opened = ~reuse
+    machine_count = int(np.count_nonzero(opened))
+
+    parent = np.empty(n, dtype=np.int64)
+    parent[start_order] = np.where(reuse, end_order[np.minimum(reused, n - 1)], start_order)
+    label = np.zeros(n, dtype=np.int64)
+    label[start_order[opened]] = np.arange(machine_count)
+    while True:
+        jumped = parent[parent]
+        if np.array_equal(jumped, parent):
+            break
+        parent = jumped
+    return machine_count, label[parent]
+
+INF = float('inf')
+
+# Hidden pool of OnlineScheduler: a treap keyed by (start, end, task_id) whose
+# nodes also keep the smallest (end, -start, key) of their subtree, so the task
+# ending first among those starting in a key range is found with two splits and
+# two merges. Every operation is O(log n) expected. Nodes are lists
+# [key, priority, left, right, best].
+class HiddenPool:
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, key):
+        node = [key, random.random(), None, None, (key[1], -key[0], key)]
+        left, right = _treap_split(self.root, key)
+        self.root = _treap_merge(_treap_merge(left, node), right)
+        self.size += 1
+
+    def remove(self, key):
+        self.root = _treap_remove(self.root, key)
+        self.size -= 1
+
+    # The task with the smallest end (latest start on ties) among keys in (lo, hi]
+    def first_ending(self, lo, hi):
+        left, right = _treap_split(self.root, hi)
+        outside, middle = _treap_split(left, lo)
+        best = middle[4][2] if middle is not None else None
+        self.root = _treap_merge(_treap_merge(outside, middle), right)
+        return best
+
+def _treap_update(node):
+    key = node[0]
+    best = (key[1], -key[0], key)
+    if node[2] is not None and node[2][4] < best:
+        best = node[2][4]
+    if node[3] is not None and node[3][4] < best:
+        best = node[3][4]
+    node[4] = best
+
+# (keys <= key, keys > key)
+def _treap_split(node, key):
+    if node is None:
+        return None, None
+    if node[0] <= key:
+        node[3], right = _treap_split(node[3], key)
+        _treap_update(node)
+        return node, right
+    left, node[2] = _treap_split(node[2], key)
+    _treap_update(node)
+    return left, node
+
+def _treap_merge(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left[1] > right[1]:
+        left[3] = _treap_merge(left[3], right)
+        _treap_update(left)
+        return left
+    right[2] = _treap_merge(left, right[2])
+    _treap_update(right)
+    return right
+
+def _treap_remove(node, key):
+    if node[0] == key:
+        return _treap_merge(node[2], node[3])
+    if key < node[0]:
+        node[2] = _treap_remove(node[2], key)
+    else:
+        node[3] = _treap_remove(node[3], key)
+    _treap_update(node)
+    return node
+
+# Incremental scheduler for tasks that arrive and get cancelled over time.
+# Earliest-end greedy never picks a task that contains another one, so only the
+# tasks containing no other task (the "staircase": starts and ends both strictly
+# increasing) are kept in one sorted list, and the rest wait in a hidden pool.
+# The accepted schedule is the greedy chain over the staircase. After an event,
+# the chain is walked again only from the last accepted task that ends before the
+# change until it rejoins the old chain. Every lookup is a bisect or a HiddenPool
+# query, so an event costs O(log n) per staircase and schedule entry that changes.
+class OnlineScheduler:
+    def __init__(self):
+        self.tasks = {}
+        self.staircase = SortedList()  # (start, end, task_id)
+        self.hidden = HiddenPool()     # (start, end, task_id), each contains some other task
+        self.chain = SortedList()      # (end, start, task_id), the accepted schedule
+        self.next_id = 0
+
+    def add(self, start, end):
+        if not start < end:
+            raise ValueError("End time must be greater than start time.")
+        task_id = self.next_id
+        self.next_id += 1
+        self.tasks[task_id] = (start, end)
+        entry = (start, end, task_id)
+
+        stairs = self.staircase
+        i = stairs.bisect_left((start,))
+        if i < len(stairs) and stairs[i][1] <= end:
+            self.hidden.add(entry)
+            return task_id
+
+        # Staircase tasks containing the new one move to the hidden pool
+        lo = start
+        if i < len(stairs) and stairs[i][0] == start:
+            self.hidden.add(stairs.pop(i))
+        while i > 0 and stairs[i - 1][1] >= end:
+            i -= 1
+            lo = stairs[i][0]
+            self.hidden.add(stairs.pop(i))
+        stairs.add(entry)
+        self._repair(lo, start)
+        return task_id
+
+    def cancel(self, task_id):
+        start, end = self.tasks.pop(task_id)
+        entry = (start, end, task_id)
+        stairs = self.staircase
+        if entry not in stairs:
+            self.hidden.remove(entry)
+            return
+
+        i = stairs.index(entry)
+        del stairs[i]
+        # Hidden tasks that contained only this task come back: they start after the
+        # previous staircase task and end before the next one. The first to end in
+        # that start range contains no other hidden task there, so it is restored and
+        # the search goes on after its start; only restored tasks are ever visited.
+        lo = (stairs[i - 1][0], INF) if i > 0 else (-INF,)
+        limit = stairs[i][1] if i < len(stairs) else INF
+        restored = []
+        while True:
+            task = self.hidden.first_ending(lo, (start, INF))
+            if task is None or task[1] >= limit:
+                break
+            self.hidden.remove(task)
+            stairs.add(task)
+            restored.append(task)
+            lo = (task[0], INF)
+        self._repair(restored[0][0] if restored else start, start)
+
+    # Re-walk the greedy chain after staircase changes between starts lo and hi
+    def _repair(self, lo, hi):
+        chain = self.chain
+        stairs = self.staircase
+        first = chain.bisect_right((lo, INF))
+        t = chain[first - 1][0] if first else -INF
+        walked = []
+        stop = len(chain)
+        while True:
+            i = stairs.bisect_left((t,))
+            if i == len(stairs):
+                break
+            start, end, task_id = stairs[i]
+            key = (end, start, task_id)
+            if end > hi and key in chain:
+                stop = chain.index(key)
+                break
+            walked.append(key)
+            t = end
+        del chain[first:stop]
+        chain.update(walked)
+
+    def count(self):
+        return len(self.chain)
+
+    # Accepted task ids in time order
+    def schedule(self):
+        return [task_id for _, _, task_id in self.chain]
+
+    # Accepted tasks overlapping [start, end)
+    def conflicts(self, start, end):
+        found = []
+        for task_end, task_start, task_id in self.chain.irange((start, INF), inclusive=(False, True)):
+            if task_start >= end:
+                break
+            found.append(task_id)
+        return found
+
+# `selected` holds task indices; with `machines` every task is drawn in its machine's lane.
+def plot_schedule(tasks, selected, machines=None):
+    lanes = 1 if machines is None else max(machines) + 1
+    fig, ax = plt.subplots(figsize=(10, 1 + lanes))
+    height = 0.3 if machines is None else 0.6
+    selected = set(selected)
     for i, (start, end) in enumerate(tasks):
-        color = 'green' if (start, end) in selected else 'gray'
+        y = 0.5 if machines is None else machines[i]
+        color = 'green' if i in selected else 'gray'
         ax.barh(y, end - start, left=start, height=height, color=color, edgecolor='black')
         ax.text(start + (end - start) / 2, y, f'Task {i+1}', ha='center', va='center', color='white', fontsize=8)
     ax.set_xlabel('Time')
-    ax.set_yticks([])
+    if machines is None:
+        ax.set_yticks([])
+    else:
+        ax.set_yticks(range(lanes))
+        ax.set_yticklabels([f'Machine {m+1}' for m in range(lanes)])
+        ax.invert_yaxis()
     ax.set_title('Task Schedule Timeline')
     ax.set_xlim(left=0)
     ax.grid(True, axis='x', linestyle='--', linewidth=0.5)
     return fig
 
+SCHEDULER_ENGINES = [
+    "Greedy (most tasks)",
+    "Weighted (highest total weight)",
+    "Multi-machine (fewest machines)",
+]
+
 def run_scheduler_app():
     st.set_page_config(page_title="Task Scheduler", layout="wide")
 
@@ -38,11 +315,12 @@ def run_scheduler_app():
     1. **Select number of tasks** using the slider.
     2. **Input start and end times** for each task.
        - End time must be greater than start time.
-    3. Click **🧠 Schedule Optimally** to see results.
+    3. **Pick an engine**: most tasks, highest total weight, or all tasks on the fewest machines.
+    4. Click **🧠 Schedule Optimally** to see results.
 
     ### Output:
     - ✅ List of scheduled (non-overlapping) tasks.
-    - 📊 Visual timeline of tasks (green = scheduled).
+    - 📊 Visual timeline of tasks (green = scheduled, one lane per machine in multi-machine mode).
 
     ### Tips:
     - Use decimal values (e.g., 3.5) for precise timing.
@@ -55,19 +333,24 @@ def run_scheduler_app():
     Useful in: **job scheduling**, **event planning**, **task queueing**, and more.
     """)
 
+    engine = st.radio("⚙️ Engine", SCHEDULER_ENGINES, horizontal=True)
     num_tasks = st.slider("🧮 Number of Tasks", min_value=1, max_value=15, value=4)
     tasks = []
+    weights = []
 
     st.subheader("🕓 Task Timings")
     for i in range(num_tasks):
         with st.expander(f"📝 Task {i+1}"):
-            col1, col2 = st.columns(2)
+            col1, col2, col3 = st.columns(3)
             with col1:
                 start = st.number_input(f"Start Time for Task {i+1}", key=f"start{i}", format="%.2f")
             with col2:
                 end = st.number_input(f"End Time for Task {i+1}", key=f"end{i}", format="%.2f")
+            with col3:
+                weight = st.number_input(f"Weight for Task {i+1}", key=f"weight{i}", min_value=0.0, value=1.0, format="%.2f")
             if start < end:
                 tasks.append((start, end))
+                weights.append(weight)
             else:
                 st.warning(f"⚠️ Task {i+1}: End time must be greater than start time.")
 
@@ -76,13 +359,31 @@ def run_scheduler_app():
             st.error("❌ No valid tasks to schedule.")
             return
 
-        selected = schedule_tasks(tasks)
-        st.success(f"✅ {len(selected)} Task(s) Scheduled Successfully!")
+        starts = [start for start, _ in tasks]
+        ends = [end for _, end in tasks]
+        machines = None
+
+        if engine == SCHEDULER_ENGINES[1]:
+            total_weight, selected = weighted_interval_schedule(starts, ends, weights)
+            selected = sorted(selected.tolist(), key=lambda i: tasks[i])
+            st.success(f"✅ {len(selected)} Task(s) Scheduled with Total Weight {total_weight:g}!")
+        elif engine == SCHEDULER_ENGINES[2]:
+            machine_count, machines = assign_machines(starts, ends)
+            machines = machines.tolist()
+            selected = sorted(range(len(tasks)), key=lambda i: (machines[i], tasks[i]))
+            st.success(f"✅ All {len(tasks)} Task(s) Scheduled on {machine_count} Machine(s)!")
+        else:
+            selected = schedule_task_indices(tasks)
+            st.success(f"✅ {len(selected)} Task(s) Scheduled Successfully!")
 
         st.markdown("### 🗓️ Scheduled Tasks:")
-        for i, (start, end) in enumerate(selected, 1):
-            st.write(f"• Task {i}: Start = {start}, End = {end}")
+        for i in selected:
+            start, end = tasks[i]
+            line = f"• Task {i+1}: Start = {start}, End = {end}"
+            if machines is not None:
+                line += f", Machine = {machines[i] + 1}"
+            st.write(line)
 
         st.markdown("### 📊 Visual Task Timeline")
-        fig = plot_schedule(tasks, selected)
+        fig = plot_schedule(tasks, selected, machines)
         st.pyplot(fig)
@@ -1,4 +1,13 @@
 import streamlit as st
+import numpy as np
+import csv
+import io
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 # Check if a number can be placed in given position
 def is_valid(board, row, col, num):
@@ -12,60 +21,855 @@ def is_valid(board, row, col, num):
                 return False
     return True
 
-# Backtracking solver
-def solve_sudoku(board):
+# Original backtracking solver, kept as a reference for benchmarks
+def solve_sudoku_backtracking(board):
     for row in range(9):
         for col in range(9):
             if board[row][col] == 0:
                 for num in range(1, 10):
                     if is_valid(board, row, col, num):
                         board[row][col] = num
-                        if solve_sudoku(board):
+                        if solve_sudoku_backtracking(board):
                             return True
                         board[row][col] = 0
                 return False
     return True
 
+# Flat 81-cell layout: bit d - 1 of a mask stands for digit d
+ALL_DIGITS = 0x1FF
+CELL_ROW = [i // 9 for i in range(81)]
+CELL_COL = [i % 9 for i in range(81)]
+CELL_BOX = [(i // 27) * 3 + (i % 9) // 3 for i in range(81)]
+UNITS = ([[r * 9 + c for c in range(9)] for r in range(9)]
+         + [[r * 9 + c for r in range(9)] for c in range(9)]
+         + [[(b // 3) * 27 + (b % 3) * 3 + (k // 3) * 9 + k % 3 for k in range(9)] for b in range(9)])
+BIT_COUNT = [bin(m).count("1") for m in range(ALL_DIGITS + 1)]
+BIT_DIGIT = {1 << d: d + 1 for d in range(9)}
+
+# Search state: the flat grid, used-digit masks per row / column / box, and the
+# trail of cells filled since the start, so a failed branch is undone by popping
+# back to a mark instead of copying the board
+def new_sudoku_state(board):
+    grid = [int(v) for row in board for v in row]
+    rows, cols, boxes = [0] * 9, [0] * 9, [0] * 9
+    for i, v in enumerate(grid):
+        if v:
+            bit = 1 << (v - 1)
+            r, c, b = CELL_ROW[i], CELL_COL[i], CELL_BOX[i]
+            if (rows[r] | cols[c] | boxes[b]) & bit:
+                return None  # the givens already clash
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+    return grid, rows, cols, boxes, []
+
+def _undo(state, mark):
+    grid, rows, cols, boxes, trail = state
+    while len(trail) > mark:
+        i = trail.pop()
+        bit = ~(1 << (grid[i] - 1))
+        rows[CELL_ROW[i]] &= bit
+        cols[CELL_COL[i]] &= bit
+        boxes[CELL_BOX[i]] &= bit
+        grid[i] = 0
+
+# Naked singles (a cell with one candidate) and hidden singles (a digit with one
+# possible cell in a row, column or box), repeated until nothing changes.
+# Returns False on a contradiction: a cell without candidates, a digit with no
+# place left in a unit, or two digits forced into the same cell.
+def _propagate(state, stats):
+    grid, rows, cols, boxes, trail = state
+    while True:
+        progress = False
+        for i in range(81):
+            if grid[i]:
+                continue
+            r, c, b = CELL_ROW[i], CELL_COL[i], CELL_BOX[i]
+            mask = ALL_DIGITS & ~(rows[r] | cols[c] | boxes[b])
+            if not mask:
+                return False
+            if not mask & (mask - 1):
+                grid[i] = BIT_DIGIT[mask]
+                rows[r] |= mask
+                cols[c] |= mask
+                boxes[b] |= mask
+                trail.append(i)
+                stats["naked"] += 1
+                progress = True
+
+        for unit in UNITS:
+            once = more = placed = 0
+            for i in unit:
+                v = grid[i]
+                if v:
+                    placed |= 1 << (v - 1)
+                    continue
+                mask = ALL_DIGITS & ~(rows[CELL_ROW[i]] | cols[CELL_COL[i]] | boxes[CELL_BOX[i]])
+                more |= once & mask
+                once |= mask
+            if (once | placed) != ALL_DIGITS:
+                return False
+            single = once & ~more & ~placed
+            while single:
+                bit = single & -single
+                single ^= bit
+                for i in unit:
+                    if grid[i] == 0:
+                        r, c, b = CELL_ROW[i], CELL_COL[i], CELL_BOX[i]
+                        if not (rows[r] | cols[c] | boxes[b]) & bit:
+                            grid[i] = BIT_DIGIT[bit]
+                            rows[r] |= bit
+                            cols[c] |= bit
+                            boxes[b] |= bit
+                            trail.append(i)
+                            stats["hidden"] += 1
+                            progress = True
+                            break
+                else:
+                    return False
+        if not progress:
+            return True
+
+# Depth-first search: propagate, then branch on the empty cell with the fewest
+# candidates. Every solution found is copied into `solutions`; stops once
+# `limit` of them are found (returns True) and otherwise leaves the state as it
+# was on entry.
+def _bitmask_search(state, limit, solutions, stats):
+    grid, rows, cols, boxes, trail = state
+    mark = len(trail)
+    stats["nodes"] += 1
+    if not _propagate(state, stats):
+        stats["dead_ends"] += 1
+        _undo(state, mark)
+        return False
+
+    best, best_mask, best_count = -1, 0, 10
+    for i in range(81):
+        if grid[i] == 0:
+            mask = ALL_DIGITS & ~(rows[CELL_ROW[i]] | cols[CELL_COL[i]] | boxes[CELL_BOX[i]])
+            count = BIT_COUNT[mask]
+            if count < best_count:
+                best, best_mask, best_count = i, mask, count
+                if count == 2:
+                    break
+    if best < 0:
+        solutions.append(grid[:])
+        if len(solutions) >= limit:
+            return True
+        _undo(state, mark)
+        return False
+
+    # A digit with fewer possible cells in some unit than the best cell has
+    # candidates is the smaller branch (the other half of what Algorithm X picks)
+    choices = [(best, bit) for bit in BIT_DIGIT if best_mask & bit]
+    if best_count > 2:
+        for unit in UNITS:
+            placed = 0
+            for i in unit:
+                if grid[i]:
+                    placed |= 1 << (grid[i] - 1)
+            for bit in BIT_DIGIT:
+                if placed & bit:
+                    continue
+                cells = [i for i in unit if grid[i] == 0
+                         and not (rows[CELL_ROW[i]] | cols[CELL_COL[i]] | boxes[CELL_BOX[i]]) & bit]
+                if len(cells) < len(choices):
+                    choices = [(i, bit) for i in cells]
+                    if len(choices) == 2:
+                        break
+            if len(choices) == 2:
+                break
+
+    for i, bit in choices:
+        stats["guesses"] += 1
+        grid[i] = BIT_DIGIT[bit]
+        rows[CELL_ROW[i]] |= bit
+        cols[CELL_COL[i]] |= bit
+        boxes[CELL_BOX[i]] |= bit
+        trail.append(i)
+        if _bitmask_search(state, limit, solutions, stats):
+            return True
+        _undo(state, len(trail) - 1)
+    _undo(state, mark)
+    return False
+
+def new_search_stats():
+    return {"nodes": 0, "guesses": 0, "dead_ends": 0, "naked": 0, "hidden": 0}
+
+# Bitmask solver: fills `board` (9 lists of 9 ints, 0 = empty) in place and
+# returns True, or returns False when there is no solution, like the original.
+# Pass a dict as `stats` to get search nodes, guesses, dead ends and how many
+# cells naked / hidden singles filled.
+def solve_sudoku(board, stats=None):
+    counts = new_search_stats()
+    state = new_sudoku_state(board)
+    solutions = []
+    if state is not None:
+        _bitmask_search(state, 1, solutions, counts)
+    if stats is not None:
+        stats.update(counts)
+    if not solutions:
+        return False
+    for r in range(9):
+        board[r][:] = solutions[0][r * 9:r * 9 + 9]
+    return True
+
+# Dancing Links (Algorithm X) for any n^2 x n^2 board. The exact-cover matrix has
+# 4 * N^2 columns (cell filled, digit in row, digit in column, digit in box) and
+# one row of 4 nodes per (cell, digit). All links live in flat int lists indexed
+# by node: 0 is the root, 1..C the column headers, then the candidate rows.
+# The untouched structure for each board size is built once and copied per solve.
+@lru_cache(maxsize=None)
+def _dlx_template(size):
+    box = math.isqrt(size)
+    columns = 4 * size * size
+    left = [i - 1 for i in range(columns + 1)]
+    right = [i + 1 for i in range(columns + 1)]
+    left[0], right[columns] = columns, 0
+    up = list(range(columns + 1))
+    down = list(range(columns + 1))
+    column = list(range(columns + 1))
+    sizes = [0] * (columns + 1)
+    candidate = [-1] * (columns + 1)
+    area = size * size
+    for r in range(size):
+        for c in range(size):
+            b = (r // box) * box + c // box
+            for d in range(size):
+                first = len(left)
+                for k, col in enumerate((1 + r * size + c, 1 + area + r * size + d,
+                                         1 + 2 * area + c * size + d, 1 + 3 * area + b * size + d)):
+                    node = first + k
+                    left.append(first + (k + 3) % 4)
+                    right.append(first + (k + 1) % 4)
+                    up.append(up[col])
+                    down.append(col)
+                    down[up[col]] = node
+                    up[col] = node
+                    column.append(col)
+                    candidate.append((r * size + c) * size + d)
+                    sizes[col] += 1
+    return tuple(left), tuple(right), tuple(up), tuple(down), tuple(column), tuple(candidate), tuple(sizes)
+
+# Side length of a square board whose side is itself a square (4, 9, 16, 25, ...)
+def board_size(board):
+    size = len(board)
+    box = math.isqrt(size)
+    if size == 0 or box * box != size or any(len(row) != size for row in board):
+        raise ValueError("Board must be N x N with N a perfect square (4, 9, 16, 25, ...).")
+    if any(not 0 <= v <= size for row in board for v in row):
+        raise ValueError(f"Cell values must be between 0 and {size}.")
+    return size
+
+# Algorithm X over the flat links. Givens are covered up front (a clash between
+# them means no solution); the search then always takes the column with the
+# fewest remaining rows and runs iteratively with an explicit stack, since 25x25
+# boards go deeper than Python's recursion limit. Returns up to `limit` solutions
+# as flat lists of digits.
+def dlx_solutions(board, limit=1, stats=None):
+    size = board_size(board)
+    template = _dlx_template(size)
+    left, right, up, down = (list(links) for links in template[:4])
+    column, candidate = template[4], template[5]
+    sizes = list(template[6])
+    columns = 4 * size * size
+    nodes = 0
+
+    def cover(col):
+        left[right[col]] = left[col]
+        right[left[col]] = right[col]
+        i = down[col]
+        while i != col:
+            j = right[i]
+            while j != i:
+                up[down[j]] = up[j]
+                down[up[j]] = down[j]
+                sizes[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(col):
+        i = up[col]
+        while i != col:
+            j = left[i]
+            while j != i:
+                sizes[column[j]] += 1
+                up[down[j]] = j
+                down[up[j]] = j
+                j = left[j]
+            i = up[i]
+        left[right[col]] = col
+        right[left[col]] = col
+
+    covered = bytearray(columns + 1)
+    givens = []
+    for r, row in enumerate(board):
+        for c, v in enumerate(row):
+            if v:
+                node = columns + 1 + 4 * ((r * size + c) * size + v - 1)
+                for j in (node, node + 1, node + 2, node + 3):
+                    if covered[column[j]]:
+                        if stats is not None:
+                            stats.update(nodes=0, solutions=0)
+                        return []
+                    covered[column[j]] = 1
+                    cover(column[j])
+                givens.append(candidate[node])
+
+    solutions = []
+    chosen = []
+    while True:
+        descend = False
+        if right[0] == 0:
+            grid = [0] * (size * size)
+            for cand in givens + [candidate[r] for r in chosen]:
+                grid[cand // size] = cand % size + 1
+            solutions.append(grid)
+            if len(solutions) >= limit:
+                break
+        else:
+            best = right[0]
+            fewest = sizes[best]
+            col = right[best]
+            while col and fewest > 1:
+                if sizes[col] < fewest:
+                    best, fewest = col, sizes[col]
+                col = right[col]
+            if fewest:
+                cover(best)
+                r = down[best]
+                chosen.append(r)
+                nodes += 1
+                j = right[r]
+                while j != r:
+                    cover(column[j])
+                    j = right[j]
+                descend = True
+        if descend:
+            continue
+
+        # Backtrack to the next untried row of the deepest column
+        while chosen:
+            r = chosen.pop()
+            j = left[r]
+            while j != r:
+                uncover(column[j])
+                j = left[j]
+            col = column[r]
+            r = down[r]
+            if r != col:
+                chosen.append(r)
+                nodes += 1
+                j = right[r]
+                while j != r:
+                    cover(column[j])
+                    j = right[j]
+                break
+            uncover(col)
+        else:
+            break
+
+    if stats is not None:
+        stats.update(nodes=nodes, solutions=len(solutions))
+    return solutions
+
+# Exact-cover solver with the same in-place contract as solve_sudoku, for any size
+def solve_sudoku_dlx(board, stats=None):
+    solutions = dlx_solutions(board, 1, stats)
+    if not solutions:
+        return False
+    size = len(board)
+    for r in range(size):
+        board[r][:] = solutions[0][r * size:(r + 1) * size]
+    return True
+
+# Number of solutions, counting stops at `limit` (2 is enough to tell unique from not)
+def count_sudoku_solutions(board, limit=2, stats=None):
+    return len(dlx_solutions(board, limit, stats))
+
+def has_unique_solution(board):
+    return count_sudoku_solutions(board, 2) == 1
+
+# A random complete grid of side box^2: the shifted base pattern with digits,
+# rows within bands, bands, columns within stacks and stacks all shuffled
+def random_full_grid(box, rng=random):
+    size = box * box
+    def shuffled(n):
+        order = list(range(n))
+        rng.shuffle(order)
+        return order
+    rows = [band * box + r for band in shuffled(box) for r in shuffled(box)]
+    cols = [stack * box + c for stack in shuffled(box) for c in shuffled(box)]
+    digits = [d + 1 for d in shuffled(size)]
+    return [[digits[(box * (r % box) + r // box + c) % size] for c in cols] for r in rows]
+
+# Board from text: one row per line, cells separated by spaces or commas; 0 or
+# '.' marks an empty cell. Lines of exactly N characters (no separators) are
+# read one character per cell for N <= 9.
+def parse_board(text, size):
+    rows = [line.strip() for line in text.strip().splitlines() if line.strip()]
+    if len(rows) == 1 and size <= 9 and len(rows[0]) == size * size:
+        rows = [rows[0][i:i + size] for i in range(0, size * size, size)]
+    board = []
+    for line in rows:
+        tokens = line.replace(",", " ").split()
+        if len(tokens) == 1 and size <= 9 and len(line) == size:
+            tokens = list(line)
+        board.append([0 if token == "." else int(token) for token in tokens])
+    if len(board) != size or any(len(row) != size for row in board):
+        raise ValueError(f"Expected {size} rows of {size} cells.")
+    board_size(board)
+    return board
+
+def format_board(board):
+    width = len(str(len(board)))
+    return "\n".join(" ".join(str(v).rjust(width) if v else ".".rjust(width) for v in row) for row in board)
+
+# Batch solving for puzzle packs in the usual one-puzzle-per-line format: 81
+# characters, digits with '0' or '.' for empty cells. Anything past the 81st
+# character (ratings, comments) is ignored, as are blank lines and '#' lines.
+BATCH_CHUNK = 256  # puzzles per pool task
+BATCH_FIELDS = ["line", "puzzle", "solution", "solutions", "ms", "nodes", "guesses", "error"]
+PUZZLE_CHARS = set("0123456789.")
+GUESS_BUCKETS = [0, 1, 2, 10, 100]
+GUESS_LABELS = ["0", "1", "2-9", "10-99", "100+"]
+
+# (line number, puzzle) pairs from file contents (bytes or str)
+def read_puzzle_lines(data):
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", errors="replace")
+    puzzles = []
+    for number, line in enumerate(data.splitlines(), 1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            puzzles.append((number, line[:81]))
+    return puzzles
+
+def load_puzzle_file(path):
+    with open(path, "rb") as f:
+        return read_puzzle_lines(f.read())
+
+# Solve one puzzle line with the bitmask engine. The search goes on past the
+# first solution up to `limit`, so `solutions` tells unique (1) from not unique
+# (limit) and impossible (0) in the same pass; malformed lines get an error.
+def solve_puzzle_line(number, line, limit=2):
+    record = {"line": number, "puzzle": line, "solution": "", "solutions": 0,
+              "ms": 0.0, "nodes": 0, "guesses": 0, "error": ""}
+    start = time.perf_counter()
+    if len(line) != 81 or not set(line) <= PUZZLE_CHARS:
+        record["error"] = "expected 81 characters of 0-9 or '.'"
+        return record
+    cells = [0 if ch == "." else int(ch) for ch in line]
+    stats = new_search_stats()
+    solutions = []
+    state = new_sudoku_state([cells[r * 9:r * 9 + 9] for r in range(9)])
+    if state is not None:
+        _bitmask_search(state, limit, solutions, stats)
+    if solutions:
+        record["solution"] = "".join(map(str, solutions[0]))
+    record.update(solutions=len(solutions), nodes=stats["nodes"], guesses=stats["guesses"],
+                  ms=round((time.perf_counter() - start) * 1000, 3))
+    return record
+
+def _solve_chunk(chunk, limit):
+    return [solve_puzzle_line(number, line, limit) for number, line in chunk]
+
+# Solve (line number, puzzle) pairs in chunks across a process pool, yielding one
+# record per puzzle in input order as the chunks come back. workers=1 solves in
+# this process. Closing the generator cancels every chunk that has not started.
+def solve_puzzle_batch(puzzles, workers=None, chunk_size=BATCH_CHUNK, limit=2):
+    chunks = [puzzles[i:i + chunk_size] for i in range(0, len(puzzles), chunk_size)]
+    if workers == 1:
+        for chunk in chunks:
+            yield from _solve_chunk(chunk, limit)
+        return
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_solve_chunk, chunk, limit) for chunk in chunks]
+        for future in futures:
+            yield from future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+# Results as CSV, one row per puzzle (BATCH_FIELDS), to an open text file
+def write_batch_results(records, out):
+    writer = csv.DictWriter(out, fieldnames=BATCH_FIELDS)
+    writer.writeheader()
+    writer.writerows(records)
+
+# Throughput, per-puzzle time and search-node percentiles, puzzles per guess
+# bucket (GUESS_LABELS), and the share of the total time spent on the slowest 1%
+def batch_summary(records, elapsed):
+    ms = np.array([r["ms"] for r in records], dtype=np.float64)
+    nodes = np.array([r["nodes"] for r in records], dtype=np.int64)
+    guesses = np.array([r["guesses"] for r in records], dtype=np.int64)
+    solutions = np.array([r["solutions"] for r in records], dtype=np.int64)
+    invalid = np.array([bool(r["error"]) for r in records], dtype=bool)
+    n = len(records)
+    summary = {
+        "puzzles": n,
+        "unique": int(np.count_nonzero(solutions == 1)),
+        "multiple": int(np.count_nonzero(solutions > 1)),
+        "unsolvable": int(np.count_nonzero((solutions == 0) & ~invalid)),
+        "invalid": int(np.count_nonzero(invalid)),
+        "seconds": elapsed,
+        "per_second": n / elapsed if elapsed > 0 else 0.0,
+        "guesses": np.bincount(np.searchsorted(GUESS_BUCKETS, guesses, side="right") - 1,
+                               minlength=len(GUESS_BUCKETS)).tolist(),
+    }
+    if n:
+        for name, values in (("ms", ms), ("nodes", nodes)):
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            summary.update({f"{name}_p50": p50, f"{name}_p90": p90, f"{name}_p99": p99,
+                            f"{name}_max": values.max()})
+        slowest = np.sort(ms)[::-1][:max(1, n // 100)]
+        summary["slowest_share"] = slowest.sum() / ms.sum() if ms.sum() > 0 else 0.0
+    return summary
+
+# Puzzle generator for 9x9 boards. A complete grid comes from random diagonal
+# boxes (which never clash) finished by the bitmask search; clues are then
+# removed in random order, each removal kept only if the puzzle stays solvable
+# the way the target difficulty allows. Every generated puzzle has exactly one
+# solution and no removable clue left for its difficulty.
+DIFFICULTIES = ["Easy", "Medium", "Hard", "Expert"]
+HARD_NODES = 8  # search nodes to prove uniqueness; above this a branching puzzle is Expert
+GENERATE_CHUNK = 25  # puzzles per pool task
+
+def random_solution_grid(rng=random):
+    cells = [0] * 81
+    for b in (0, 4, 8):
+        digits = list(range(1, 10))
+        rng.shuffle(digits)
+        for k, d in enumerate(digits):
+            cells[(b // 3 * 3 + k // 3) * 9 + b % 3 * 3 + k % 3] = d
+    solutions = []
+    _bitmask_search(new_sudoku_state([cells]), 1, solutions, new_search_stats())
+    return solutions[0]
+
+# Naked singles only, repeated until stuck (the first half of _propagate)
+def _naked_singles(state, stats):
+    grid, rows, cols, boxes, trail = state
+    progress = True
+    while progress:
+        progress = False
+        for i in range(81):
+            if grid[i]:
+                continue
+            r, c, b = CELL_ROW[i], CELL_COL[i], CELL_BOX[i]
+            mask = ALL_DIGITS & ~(rows[r] | cols[c] | boxes[b])
+            if not mask:
+                return False
+            if not mask & (mask - 1):
+                grid[i] = BIT_DIGIT[mask]
+                rows[r] |= mask
+                cols[c] |= mask
+                boxes[b] |= mask
+                trail.append(i)
+                stats["naked"] += 1
+                progress = True
+    return True
+
+# Difficulty by the techniques the solution needs: naked singles alone (Easy),
+# hidden singles as well (Medium), or branching, where the size of the search
+# tree that proves uniqueness splits Hard from Expert. Expects a puzzle with a
+# unique solution; returns the difficulty with clue, single and search counts.
+def grade_puzzle(board):
+    state = new_sudoku_state(board)
+    if state is None:
+        raise ValueError("The givens clash.")
+    grid = state[0]
+    stats = new_search_stats()
+    clues = 81 - grid.count(0)
+    if _naked_singles(state, stats) and 0 not in grid:
+        difficulty = "Easy"
+    elif _propagate(state, stats) and 0 not in grid:
+        difficulty = "Medium"
+    else:
+        _bitmask_search(state, 2, [], stats)
+        difficulty = "Hard" if stats["nodes"] <= HARD_NODES else "Expert"
+    return {"difficulty": difficulty, "clues": clues, "naked": stats["naked"], "hidden": stats["hidden"],
+            "nodes": stats["nodes"], "guesses": stats["guesses"]}
+
+def _solved_by_singles(cells, hidden):
+    state = new_sudoku_state([cells])
+    stats = new_search_stats()
+    solved = _propagate(state, stats) if hidden else _naked_singles(state, stats)
+    return solved and 0 not in state[0]
+
+# Uniqueness after emptying the `removed` (cell, digit) pairs of a unique
+# puzzle: a second solution must put another digit in one of those cells, so
+# each other candidate is tried in turn and the search stops at the first
+# solution found, instead of counting solutions from scratch.
+def _has_other_solution(cells, removed):
+    state = new_sudoku_state([cells])
+    grid, rows, cols, boxes, trail = state
+    stats = new_search_stats()
+    for i, value in removed:
+        r, c, b = CELL_ROW[i], CELL_COL[i], CELL_BOX[i]
+        mask = ALL_DIGITS & ~(rows[r] | cols[c] | boxes[b]) & ~(1 << (value - 1))
+        for bit in BIT_DIGIT:
+            if mask & bit:
+                grid[i] = BIT_DIGIT[bit]
+                rows[r] |= bit
+                cols[c] |= bit
+                boxes[b] |= bit
+                trail.append(i)
+                if _bitmask_search(state, 1, [], stats):
+                    return True
+                _undo(state, 0)
+    return False
+
+# One puzzle of the given difficulty. Easy and Medium remove clues as long as
+# singles still solve the puzzle (which also makes it unique); Hard and Expert
+# remove clues while the solution stays unique and retry with a fresh grid until
+# the grade matches. With `symmetric`, clues go in 180-degree rotation pairs.
+def generate_puzzle(difficulty="Medium", rng=random, symmetric=False):
+    if difficulty not in DIFFICULTIES:
+        raise ValueError(f"Difficulty must be one of {', '.join(DIFFICULTIES)}.")
+    while True:
+        solution = random_solution_grid(rng)
+        cells = solution[:]
+        order = list(range(81))
+        rng.shuffle(order)
+        for i in order:
+            group = {i, 80 - i} if symmetric else {i}
+            if any(cells[j] == 0 for j in group):
+                continue
+            removed = [(j, cells[j]) for j in group]
+            for j, _ in removed:
+                cells[j] = 0
+            if difficulty in ("Easy", "Medium"):
+                keep = _solved_by_singles(cells, difficulty == "Medium")
+            else:
+                keep = not _has_other_solution(cells, removed)
+            if not keep:
+                for j, value in removed:
+                    cells[j] = value
+        grade = grade_puzzle([cells])
+        if grade["difficulty"] == difficulty:
+            grade.update(puzzle="".join(map(str, cells)), solution="".join(map(str, solution)))
+            return grade
+
+def _generate_chunk(difficulty, count, seed, symmetric):
+    rng = random.Random(seed)
+    return [generate_puzzle(difficulty, rng, symmetric) for _ in range(count)]
+
+# Generate `count` puzzles across a process pool like solve_puzzle_batch,
+# yielding each record (puzzle, solution and grade_puzzle fields) in order.
+# Each chunk has its own seed derived from `seed`, so a pool is reproducible.
+def generate_puzzle_pool(difficulty, count, workers=None, seed=0, symmetric=False, chunk_size=GENERATE_CHUNK):
+    tasks = [(difficulty, min(chunk_size, count - start), f"{seed}:{start}", symmetric)
+             for start in range(0, count, chunk_size)]
+    if workers == 1:
+        for task in tasks:
+            yield from _generate_chunk(*task)
+        return
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_generate_chunk, *task) for task in tasks]
+        for future in futures:
+            yield from future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+SUDOKU_SIZES = {"4×4": 4, "9×9": 9, "16×16": 16, "25×25": 25}
+SAMPLE_CLUES = 0.6  # fraction of cells kept in the sample puzzles for larger boards
+
+def sample_puzzle(size, seed=0):
+    rng = random.Random(seed)
+    grid = random_full_grid(math.isqrt(size), rng)
+    return [[v if rng.random() < SAMPLE_CLUES else 0 for v in row] for row in grid]
+
+SUDOKU_MODES = ["Single puzzle", "Batch file", "Generate puzzles"]
+
+def run_sudoku_batch_app():
+    st.markdown("""
+    Solve a whole **puzzle pack** across worker processes: one 9×9 puzzle per line, 81 characters
+    (0 or . for empty cells). Every puzzle is checked for a **unique solution** as it is solved.
+    """)
+    upload = st.file_uploader("Puzzle file", type=["txt", "sdk", "csv"])
+    if upload is None:
+        return
+    puzzles = read_puzzle_lines(upload.getvalue())
+    st.caption(f"Loaded {len(puzzles):,} puzzles.")
+    workers = os.cpu_count() or 1
+    if workers > 1:
+        workers = st.slider("⚙️ Worker processes", min_value=1, max_value=workers, value=workers)
+
+    if st.button("🚀 Solve Batch"):
+        if not puzzles:
+            st.error("❌ No puzzles found in the file.")
+            return
+        progress = st.progress(0.0)
+        status = st.empty()
+        records = []
+        start = time.perf_counter()
+        for record in solve_puzzle_batch(puzzles, workers):
+            records.append(record)
+            if len(records) % BATCH_CHUNK == 0 or len(records) == len(puzzles):
+                progress.progress(len(records) / len(puzzles))
+                rate = len(records) / max(time.perf_counter() - start, 1e-9)
+                status.markdown(f"⏳ {len(records):,}/{len(puzzles):,} puzzles solved — {rate:,.0f} puzzles/s")
+        elapsed = time.perf_counter() - start
+        status.empty()
+        summary = batch_summary(records, elapsed)
+        st.success(f"✅ {summary['puzzles']:,} puzzles in {elapsed:.2f} s ({summary['per_second']:,.0f} puzzles/s)")
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Unique", f"{summary['unique']:,}")
+        col2.metric("Multiple solutions", f"{summary['multiple']:,}")
+        col3.metric("No solution", f"{summary['unsolvable']:,}")
+        col4.metric("Invalid lines", f"{summary['invalid']:,}")
+
+        st.markdown("### ⏱️ Time per Puzzle")
+        st.write(f"p50 {summary['ms_p50']:.2f} ms · p90 {summary['ms_p90']:.2f} ms · "
+                 f"p99 {summary['ms_p99']:.2f} ms · max {summary['ms_max']:.1f} ms")
+        st.markdown("### 🔍 Search Effort")
+        st.write(f"Search nodes: p50 {summary['nodes_p50']:.0f} · p90 {summary['nodes_p90']:.0f} · "
+                 f"p99 {summary['nodes_p99']:.0f} · max {summary['nodes_max']:,}. "
+                 f"The slowest 1% of puzzles took {summary['slowest_share']:.0%} of the solving time.")
+        st.table([{"Guesses": label, "Puzzles": count, "Share": f"{count / summary['puzzles']:.1%}"}
+                  for label, count in zip(GUESS_LABELS, summary["guesses"])])
+        st.markdown("### 🐢 Slowest Puzzles")
+        st.dataframe(sorted(records, key=lambda r: r["ms"], reverse=True)[:10])
+
+        out = io.StringIO()
+        write_batch_results(records, out)
+        st.download_button("💾 Download Results (CSV)", out.getvalue(), file_name="sudoku_results.csv",
+                           mime="text/csv")
+
+def run_sudoku_generator_app():
+    st.markdown("""
+    Generate fresh 9×9 puzzles with a **unique solution**, graded by what it takes to solve them:  
+    **Easy** — naked singles only · **Medium** — hidden singles too · **Hard** — a little branching ·
+    **Expert** — deeper search.
+    """)
+    col1, col2, col3 = st.columns(3)
+    difficulty = col1.selectbox("🎚️ Difficulty", DIFFICULTIES, index=1)
+    count = col2.number_input("Number of puzzles", min_value=1, max_value=10000, value=10)
+    seed = col3.number_input("Random Seed", min_value=0, value=0)
+    symmetric = st.checkbox("Symmetric clues (180° rotation)")
+    workers = os.cpu_count() or 1
+    if workers > 1:
+        workers = st.slider("⚙️ Worker processes", min_value=1, max_value=workers, value=workers)
+
+    if st.button("🎲 Generate Puzzles"):
+        count = int(count)
+        progress = st.progress(0.0)
+        records = []
+        start = time.perf_counter()
+        for record in generate_puzzle_pool(difficulty, count, workers, int(seed), symmetric):
+            records.append(record)
+            progress.progress(len(records) / count)
+        elapsed = time.perf_counter() - start
+        st.success(f"✅ {count:,} {difficulty} puzzle(s) in {elapsed:.2f} s ({count / elapsed:,.1f} puzzles/s)")
+
+        first = [int(ch) for ch in records[0]["puzzle"]]
+        st.markdown("### 🧩 First Puzzle:")
+        st.code(format_board([first[r * 9:r * 9 + 9] for r in range(9)]))
+        st.caption(f"Clues: {records[0]['clues']} · naked singles: {records[0]['naked']} · "
+                   f"hidden singles: {records[0]['hidden']} · search nodes: {records[0]['nodes']}")
+        st.dataframe([{key: record[key] for key in ("puzzle", "clues", "naked", "hidden", "nodes", "guesses")}
+                      for record in records[:1000]])
+        text = "\n".join(record["puzzle"] for record in records) + "\n"
+        st.download_button("💾 Download Puzzles", text, file_name=f"sudoku_{difficulty.lower()}.txt",
+                           mime="text/plain")
+
 def run_sudoku_solver_app():
     st.title("🧩 Sudoku Solver")
+    mode = st.radio("🎯 Mode", SUDOKU_MODES, horizontal=True)
+    if mode == SUDOKU_MODES[1]:
+        run_sudoku_batch_app()
+        return
+    if mode == SUDOKU_MODES[2]:
+        run_sudoku_generator_app()
+        return
     st.markdown("""
     Enter your Sudoku puzzle below (use 0 for empty cells).  
-    The solver uses **Backtracking** to find the solution.
+    9×9 boards are solved with **constraint propagation** (naked and hidden singles) and **backtracking** on the
+    most constrained cell; any size can use **Dancing Links** (exact cover), which can also **count solutions**.
 
     **Instructions:**  
-    - Input exactly 9 rows.  
-    - Each row must have 9 numbers separated by spaces (0-9).  
+    - Pick the board size (4×4 to 25×25).  
+    - 9×9: input exactly 9 rows, each with 9 numbers separated by spaces (0-9).  
+    - Larger boards: one row per line in the text box (0 or . for empty cells).  
     - Use 0 for empty cells.
     """)
 
+    size = SUDOKU_SIZES[st.selectbox("📐 Board Size", list(SUDOKU_SIZES), index=1)]
     board_input = []
     input_valid = True
 
-    # Collect 9 rows of inputs in columns for better layout
-    cols = st.columns(3)
-    for i in range(9):
-        col = cols[i % 3]
-        row_str = col.text_input(f"Row {i+1}", "0 0 0 0 0 0 0 0 0", key=f"row{i}")
-        try:
-            row_vals = list(map(int, row_str.strip().split()))
-            if len(row_vals) != 9 or any(n < 0 or n > 9 for n in row_vals):
+    if size == 9:
+        # Collect 9 rows of inputs in columns for better layout
+        cols = st.columns(3)
+        for i in range(9):
+            col = cols[i % 3]
+            row_str = col.text_input(f"Row {i+1}", "0 0 0 0 0 0 0 0 0", key=f"row{i}")
+            try:
+                row_vals = list(map(int, row_str.strip().split()))
+                if len(row_vals) != 9 or any(n < 0 or n > 9 for n in row_vals):
+                    input_valid = False
+                    col.error("Each row must have exactly 9 numbers between 0 and 9.")
+                board_input.append(row_vals)
+            except Exception:
                 input_valid = False
-                col.error("Each row must have exactly 9 numbers between 0 and 9.")
-            board_input.append(row_vals)
-        except Exception:
+                col.error("Invalid input. Please enter numbers only.")
+        engine = st.radio("⚙️ Engine", ["Bitmask propagation", "Dancing Links"], horizontal=True)
+    else:
+        text = st.text_area(f"Puzzle ({size} rows of {size} cells)", format_board(sample_puzzle(size)),
+                            height=min(60 + 24 * size, 640), key=f"puzzle{size}")
+        try:
+            board_input = parse_board(text, size)
+        except Exception as e:
             input_valid = False
-            col.error("Invalid input. Please enter numbers only.")
+            st.error(f"Invalid input: {e}")
+        engine = "Dancing Links"
 
-    if st.button("🚀 Solve Sudoku") and input_valid:
+    col1, col2, col3 = st.columns(3)
+    solve = col1.button("🚀 Solve Sudoku")
+    count = col2.button("🔢 Count Solutions")
+    limit = col3.number_input("Count up to", min_value=2, max_value=100000, value=2)
+
+    if solve or count:
+        if not input_valid:
+            st.error("⚠️ Please fix input errors above before solving.")
+            return
         board = [row[:] for row in board_input]  # copy input
-        if solve_sudoku(board):
-            st.success("✅ Sudoku Solved!")
+        stats = {}
+        start = time.perf_counter()
+        if count:
+            found = count_sudoku_solutions(board, int(limit), stats)
+            elapsed = time.perf_counter() - start
+            if found == 0:
+                st.error("❌ No solution exists for the given puzzle.")
+            elif found == 1:
+                st.success(f"✅ The puzzle has a unique solution (checked in {elapsed * 1000:.1f} ms).")
+            elif found < limit:
+                st.warning(f"⚠️ The puzzle has exactly {found} solutions (counted in {elapsed * 1000:.1f} ms).")
+            else:
+                st.warning(f"⚠️ The puzzle has at least {found} solutions (stopped at the limit after {elapsed * 1000:.1f} ms).")
+            st.caption(f"Search nodes: {stats['nodes']}")
+            return
+
+        if engine == "Bitmask propagation":
+            solved = solve_sudoku(board, stats)
+        else:
+            solved = solve_sudoku_dlx(board, stats)
+        elapsed = time.perf_counter() - start
+        if solved:
+            st.success(f"✅ Sudoku Solved in {elapsed * 1000:.1f} ms!")
             # Display solved board nicely
             st.markdown("### Solved Puzzle:")
-            for row in board:
-                st.write(" ".join(str(num) for num in row))
+            if size == 9:
+                for row in board:
+                    st.write(" ".join(str(num) for num in row))
+            else:
+                st.code(format_board(board))
+            if engine == "Bitmask propagation":
+                st.caption(f"Search nodes: {stats['nodes']} · guesses: {stats['guesses']} · "
+                           f"naked singles: {stats['naked']} · hidden singles: {stats['hidden']}")
+            else:
+                st.caption(f"Search nodes: {stats['nodes']}")
         else:
             st.error("❌ No solution exists for the given puzzle.")
-    elif st.button("🚀 Solve Sudoku") and not input_valid:
-        st.error("⚠️ Please fix input errors above before solving.")
-
@@ -1,12 +1,21 @@
 import streamlit as st
+import io
 import itertools
+import math
+import time
+from collections import deque
 import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from scipy.spatial import cKDTree, Delaunay, QhullError
+from scipy.spatial.distance import cdist
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import minimum_spanning_tree
 
 def calculate_total_distance(route, distances):
     total = 0
     for i in range(len(route)):
-        total += distances[route[i - 1]][route[i]]
-    total += distances[route[-1]][route[0]]  # return to start
+        total += distances[route[i - 1]][route[i]]  # i = 0 is the edge back to the start
     return total
 
 def solve_tsp_brute_force(distances):
@@ -22,77 +31,707 @@ def solve_tsp_brute_force(distances):
             best_route = route
     return best_route, min_distance
 
+# Hard limit of solve_tsp_held_karp. At 22 cities the 2^21 x 21 float64 cost table
+# alone is ~350 MB; with the parent table and the per-layer temporaries a solve
+# peaks near 730 MB RSS and takes ~9 s. The app stops at EXACT_CITIES (20 cities:
+# ~2 s, ~125 MB over the interpreter) and hands larger inputs to the heuristic.
+HELD_KARP_MAX = 22
+EXACT_CITIES = 20
+
+# Held-Karp DP with city 0 fixed as the start. cost[mask, j] is the cheapest path
+# from city 0 through the cities in `mask` (bit k = city k + 1) ending at city j + 1.
+# Subsets are processed one popcount layer at a time: for every end city j, all
+# masks of the layer containing j are relaxed at once from cost[mask ^ bit j, :]
+# plus column j of the distance matrix, and the argmin is kept as the parent.
+# Works for asymmetric matrices too; returns the same (route, distance) shape as
+# the brute force.
+def solve_tsp_held_karp(distances):
+    distances = np.asarray(distances)
+    n = len(distances)
+    if n <= 2:
+        route = list(range(n))
+        return route, calculate_total_distance(route, distances) if n else 0
+    if n > HELD_KARP_MAX:
+        raise ValueError(f"Held-Karp is limited to {HELD_KARP_MAX} cities.")
+
+    d = distances.astype(np.float64)
+    m = n - 1
+    inner = d[1:, 1:]
+    size = 1 << m
+    cost = np.full((size, m), np.inf)
+    parent = np.zeros((size, m), dtype=np.int8)
+    singles = 1 << np.arange(m)
+    cost[singles, np.arange(m)] = d[0, 1:]
+
+    masks = np.arange(size, dtype=np.int64)
+    popcount = np.zeros(size, dtype=np.int8)
+    for k in range(m):
+        popcount += (masks >> k) & 1
+    layers = np.argsort(popcount, kind='stable')
+    bounds = np.searchsorted(popcount[layers], np.arange(m + 2))
+
+    for k in range(2, m + 1):
+        layer = layers[bounds[k]:bounds[k + 1]]
+        for j in range(m):
+            ending = layer[(layer >> j) & 1 == 1]
+            candidates = cost[ending ^ (1 << j)] + inner[:, j]
+            best = np.argmin(candidates, axis=1)
+            cost[ending, j] = candidates[np.arange(len(ending)), best]
+            parent[ending, j] = best
+
+    closing = cost[size - 1] + d[1:, 0]
+    j = int(np.argmin(closing))
+    min_distance = closing[j]
+    route = []
+    mask = size - 1
+    while mask:
+        route.append(j + 1)
+        previous = int(parent[mask, j])
+        mask ^= 1 << j
+        j = previous
+    route.append(0)
+    route.reverse()
+
+    if np.issubdtype(distances.dtype, np.integer):
+        min_distance = int(round(min_distance))
+    else:
+        min_distance = float(min_distance)
+    return route, min_distance
+
+HEURISTIC_NEIGHBORS = 10  # candidate list size per city for construction and local search
+HEURISTIC_EPS = 1e-9
+
+# Distance lookups for the heuristic: a scalar one for single edges and a
+# vectorized one for arrays of cities (either side may also be a single city).
+# Coordinates are measured on the fly; a precomputed matrix is just indexed.
+def point_measure(points):
+    coords = points.tolist()
+
+    def dist(u, v):
+        return math.dist(coords[u], coords[v])
+
+    def dists(u, v):
+        return np.sqrt(((points[u] - points[v]) ** 2).sum(axis=-1))
+    return dist, dists
+
+def matrix_measure(distances):
+    def dist(u, v):
+        return float(distances[u, v])
+
+    def dists(u, v):
+        return distances[u, v].astype(np.float64)
+    return dist, dists
+
+def tour_length(route, dists):
+    route = np.asarray(route)
+    return float(dists(route, np.roll(route, -1)).sum())
+
+# k nearest other cities per city, from one KD-tree query. The city itself is
+# dropped explicitly, since with duplicate points it is not always column 0.
+def neighbor_lists(points, k):
+    n = len(points)
+    dist, idx = cKDTree(points).query(points, k=k + 1)
+    keep = idx != np.arange(n)[:, None]
+    keep[keep.sum(axis=1) > k, -1] = False
+    return idx[keep].reshape(n, k), dist[keep].reshape(n, k)
+
+# Same lists from a distance matrix, with argpartition over blocks of rows
+def matrix_neighbor_lists(distances, k, block=1024):
+    n = len(distances)
+    neighbors = np.empty((n, k), dtype=np.int64)
+    neighbor_dist = np.empty((n, k))
+    for lo in range(0, n, block):
+        rows = np.arange(lo, min(lo + block, n))
+        part = distances[rows].astype(np.float64)
+        part[np.arange(len(rows)), rows] = np.inf
+        idx = np.argpartition(part, k - 1, axis=1)[:, :k]
+        d = np.take_along_axis(part, idx, axis=1)
+        order = np.argsort(d, axis=1, kind='stable')
+        neighbors[rows] = np.take_along_axis(idx, order, axis=1)
+        neighbor_dist[rows] = np.take_along_axis(d, order, axis=1)
+    return neighbors, neighbor_dist
+
+# Nearest neighbor tour. The KD-tree only holds unvisited cities and is rebuilt
+# once half of them have been visited, so the k-nearest query (widened while
+# every hit is already visited) stays short.
+def nearest_neighbor_tour(points):
+    n = len(points)
+    visited = np.zeros(n, dtype=bool)
+    visited[0] = True
+    remaining = np.arange(n)
+    tree = cKDTree(points)
+    route = [0]
+    current = 0
+    stale = 1
+    for _ in range(n - 1):
+        k = 8
+        while True:
+            k = min(k, len(remaining))
+            _, idx = tree.query(points[current], k=k)
+            candidates = remaining[np.atleast_1d(idx)]
+            free = candidates[~visited[candidates]]
+            if len(free):
+                break
+            k *= 4
+        current = int(free[0])
+        visited[current] = True
+        route.append(current)
+        stale += 1
+        if stale * 2 >= len(remaining) and len(remaining) > 16:
+            remaining = np.flatnonzero(~visited)
+            tree = cKDTree(points[remaining])
+            stale = 0
+    return route
+
+# Nearest neighbor tour over a distance matrix: one masked row argmin per step
+def nearest_neighbor_tour_matrix(distances):
+    n = len(distances)
+    visited = np.zeros(n, dtype=bool)
+    visited[0] = True
+    route = [0]
+    current = 0
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, distances[current])
+        current = int(np.argmin(row))
+        visited[current] = True
+        route.append(current)
+    return route
+
+# Greedy edge tour: candidate edges from the neighbor lists are taken shortest
+# first while both ends have degree < 2 and no cycle is closed (union-find). The
+# resulting path fragments are then chained by nearest free endpoint.
+def greedy_edge_tour(neighbors, neighbor_dist, dists):
+    n, k = neighbors.shape
+    a = np.repeat(np.arange(n), k)
+    b = neighbors.ravel()
+    codes, first = np.unique(np.minimum(a, b) * n + np.maximum(a, b), return_index=True)
+    a, b = codes // n, codes % n
+    order = np.argsort(neighbor_dist.ravel()[first], kind='stable')
+
+    root = list(range(n))
+    def find(x):
+        while root[x] != x:
+            root[x] = root[root[x]]
+            x = root[x]
+        return x
+
+    degree = [0] * n
+    links = [[] for _ in range(n)]
+    for u, v in zip(a[order].tolist(), b[order].tolist()):
+        if degree[u] < 2 and degree[v] < 2:
+            ru, rv = find(u), find(v)
+            if ru != rv:
+                root[ru] = rv
+                degree[u] += 1
+                degree[v] += 1
+                links[u].append(v)
+                links[v].append(u)
+
+    fragments = []
+    seen = [False] * n
+    for start in range(n):
+        if degree[start] < 2 and not seen[start]:
+            path = [start]
+            seen[start] = True
+            previous, current = -1, start
+            while True:
+                step = [x for x in links[current] if x != previous]
+                if not step:
+                    break
+                previous, current = current, step[0]
+                path.append(current)
+                seen[current] = True
+            fragments.append(path)
+
+    heads = np.array([path[0] for path in fragments])
+    tails = np.array([path[-1] for path in fragments])
+    used = np.zeros(len(fragments), dtype=bool)
+    used[0] = True
+    route = list(fragments[0])
+    for _ in range(len(fragments) - 1):
+        to_head = dists(heads, route[-1])
+        to_tail = dists(tails, route[-1])
+        to_head[used] = np.inf
+        to_tail[used] = np.inf
+        h, t = int(np.argmin(to_head)), int(np.argmin(to_tail))
+        if to_head[h] <= to_tail[t]:
+            route.extend(fragments[h])
+            used[h] = True
+        else:
+            route.extend(reversed(fragments[t]))
+            used[t] = True
+    return route
+
+# 2-opt and Or-opt local search on an array tour with a position index. Each city
+# popped from the work queue (the queue plus `queued` are the don't-look bits)
+# tries, against all of its candidate neighbors at once in NumPy:
+#   2-opt  - replace edges (a, succ a) and (c, succ c) by (a, c) and (succ a, succ c),
+#            and the same with predecessors; the shorter side is reversed
+#   Or-opt - move the segment of 1-3 cities starting at a between any candidate
+#            edge next to one of its neighbors, in either orientation
+# The best improving move is applied and the cities at its ends re-queued. Stops
+# at a local optimum or at `deadline`; returns (route, moves applied, cities checked).
+def improve_tour(route, neighbors, neighbor_dist, dist, dists, deadline):
+    n = len(route)
+    tour = np.array(route, dtype=np.int64)
+    pos = np.empty(n, dtype=np.int64)
+    pos[tour] = np.arange(n)
+    queue = deque(route)
+    queued = bytearray([1]) * n
+    moves = checks = 0
+
+    def reverse(i, j):
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j, length = (j + 1) % n, (i - 1) % n, n - length
+        idx = (i + np.arange(length)) % n
+        cities = tour[idx][::-1]
+        tour[idx] = cities
+        pos[cities] = idx
+
+    while queue and time.perf_counter() < deadline:
+        a = queue.popleft()
+        queued[a] = 0
+        checks += 1
+        cand = neighbors[a]
+        cand_dist = neighbor_dist[a]
+        touched = None
+
+        for step in (1, -1):
+            b = int(tour[(pos[a] + step) % n])
+            d_ab = dist(a, b)
+            close = cand_dist < d_ab
+            if not close.any():
+                continue
+            c = cand[close]
+            d = tour[(pos[c] + step) % n]
+            gain = d_ab + dists(c, d) - cand_dist[close] - dists(d, b)
+            best = int(np.argmax(gain))
+            if gain[best] > HEURISTIC_EPS:
+                c, d = int(c[best]), int(d[best])
+                if step == 1:
+                    reverse(pos[b], pos[c])
+                else:
+                    reverse(pos[a], pos[d])
+                touched = (a, b, c, d)
+                break
+
+        if touched is None:
+            for length in (1, 2, 3):
+                if length > n - 3:
+                    break
+                first = int(pos[a])
+                last = int(tour[(first + length - 1) % n])
+                before = int(tour[first - 1])
+                after = int(tour[(first + length) % n])
+                removed = dist(before, a) + dist(last, after) - dist(before, after)
+                if removed <= HEURISTIC_EPS:
+                    continue
+                c = np.concatenate((cand, neighbors[last]))
+                x = np.concatenate((c, tour[(pos[c] - 1) % n]))
+                y = np.concatenate((tour[(pos[c] + 1) % n], c))
+                outside = ((pos[x] - first) % n >= length) & ((pos[y] - first) % n >= length)
+                if not outside.any():
+                    continue
+                x, y = x[outside], y[outside]
+                forward = dists(x, a) + dists(y, last)
+                backward = dists(x, last) + dists(y, a)
+                gain = removed - (np.minimum(forward, backward) - dists(x, y))
+                best = int(np.argmax(gain))
+                if gain[best] > HEURISTIC_EPS:
+                    x, y = int(x[best]), int(y[best])
+                    segment = tour[(first + np.arange(length)) % n]
+                    if backward[best] < forward[best]:
+                        segment = segment[::-1]
+                    rest = np.roll(tour, -(first + length))[:n - length]
+                    at = (int(pos[x]) - first - length) % n + 1
+                    tour[:] = np.concatenate((rest[:at], segment, rest[at:]))
+                    pos[tour] = np.arange(n)
+                    touched = (a, last, before, after, x, y)
+                    break
+
+        if touched is not None:
+            moves += 1
+            for city in touched:
+                if not queued[city]:
+                    queued[city] = 1
+                    queue.append(city)
+    return tour.tolist(), moves, checks
+
+# Best 1-tree among the MST leaves: removing a leaf v from the MST leaves an MST
+# of the other cities, so MST + (second-nearest distance of v) is a lower bound.
+def one_tree_bound(mst_weight, degree, neighbor_dist):
+    leaves = degree == 1
+    extra = neighbor_dist[leaves, 1].max() if leaves.any() and neighbor_dist.shape[1] > 1 else 0.0
+    return float(mst_weight + extra)
+
+# 1-tree lower bound for coordinates, with the Euclidean MST built on the
+# Delaunay edges. Degenerate (e.g. collinear) inputs fall back to twice the longest
+# distance found by a double sweep, which any tour must cover.
+def tour_lower_bound(points, neighbor_dist):
+    n = len(points)
+    try:
+        simplices = Delaunay(points).simplices
+    except QhullError:
+        far = int(np.argmax(((points - points[0]) ** 2).sum(axis=1)))
+        return 2 * float(np.sqrt(((points - points[far]) ** 2).sum(axis=1)).max())
+    corners = simplices.shape[1]
+    pairs = np.array([(i, j) for i in range(corners) for j in range(i + 1, corners)])
+    u = simplices[:, pairs[:, 0]].ravel()
+    v = simplices[:, pairs[:, 1]].ravel()
+    codes = np.unique(np.minimum(u, v) * n + np.maximum(u, v))  # shared edges would be summed
+    u, v = codes // n, codes % n
+    graph = coo_matrix((np.sqrt(((points[u] - points[v]) ** 2).sum(axis=1)), (u, v)), shape=(n, n))
+    tree = minimum_spanning_tree(graph.tocsr()).tocoo()
+    degree = np.bincount(tree.row, minlength=n) + np.bincount(tree.col, minlength=n)
+    return one_tree_bound(tree.data.sum(), degree, neighbor_dist)
+
+# 1-tree lower bound for a distance matrix, with a dense O(n^2) Prim's MST that
+# only keeps one row of best connection costs
+def matrix_lower_bound(distances, neighbor_dist):
+    n = len(distances)
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[0] = True
+    best = distances[0].astype(np.float64)
+    link = np.zeros(n, dtype=np.int64)
+    degree = np.zeros(n, dtype=np.int64)
+    weight = 0.0
+    for _ in range(n - 1):
+        best[in_tree] = np.inf
+        v = int(np.argmin(best))
+        weight += best[v]
+        degree[v] += 1
+        degree[link[v]] += 1
+        in_tree[v] = True
+        closer = distances[v] < best
+        best[closer] = distances[v][closer]
+        link[closer] = v
+    return one_tree_bound(weight, degree, neighbor_dist)
+
+# Heuristic TSP for hundreds to thousands of cities, given as coordinates
+# (Euclidean, KD-tree neighbor lists) or as a symmetric distance matrix:
+# nearest neighbor or greedy edge start, then 2-opt + Or-opt until a local optimum
+# or the time budget runs out. Returns (route starting at city 0, length); pass a
+# dict as `stats` to get iterations (improving moves), checked cities, the lower
+# bound and the gap to it.
+def solve_tsp_heuristic(points=None, time_budget=5.0, construction="nearest", stats=None, distances=None):
+    started = time.perf_counter()
+    deadline = started + time_budget
+    if distances is not None:
+        distances = np.asarray(distances)
+        dist, dists = matrix_measure(distances)
+        n = len(distances)
+    else:
+        points = np.asarray(points, dtype=np.float64)
+        dist, dists = point_measure(points)
+        n = len(points)
+    if n <= 3:
+        route = list(range(n))
+        length = tour_length(route, dists) if n else 0.0
+        if stats is not None:
+            stats.update(iterations=0, checked=0, start_length=length, lower_bound=length, gap=0.0,
+                         seconds=time.perf_counter() - started)
+        return route, length
+
+    k = min(HEURISTIC_NEIGHBORS, n - 1)
+    if distances is not None:
+        neighbors, neighbor_dist = matrix_neighbor_lists(distances, k)
+    else:
+        neighbors, neighbor_dist = neighbor_lists(points, k)
+    if construction == "greedy":
+        route = greedy_edge_tour(neighbors, neighbor_dist, dists)
+    elif distances is not None:
+        route = nearest_neighbor_tour_matrix(distances)
+    else:
+        route = nearest_neighbor_tour(points)
+    start_length = tour_length(route, dists)
+    route, moves, checks = improve_tour(route, neighbors, neighbor_dist, dist, dists, deadline)
+    zero = route.index(0)
+    route = route[zero:] + route[:zero]
+    length = tour_length(route, dists)
+
+    if stats is not None:
+        if distances is not None:
+            bound = matrix_lower_bound(distances, neighbor_dist)
+        else:
+            bound = tour_lower_bound(points, neighbor_dist)
+        stats.update(iterations=moves, checked=checks, start_length=start_length, lower_bound=bound,
+                     gap=length / bound - 1 if bound > 0 else 0.0, seconds=time.perf_counter() - started)
+    return route, length
+
+EARTH_RADIUS_KM = 6371.0088
+MATRIX_MAX_CITIES = 8000  # an 8000 x 8000 float32 matrix is 256 MB
+CDIST_BLOCK = 1024
+
+# Smallest dtype that holds the matrix: int32 for integer distances that fit,
+# float32 otherwise (kilometres or coordinate units do not need float64 here)
+def compact_distances(distances):
+    distances = np.asarray(distances)
+    if np.issubdtype(distances.dtype, np.integer):
+        if distances.size == 0 or np.abs(distances).max() <= np.iinfo(np.int32).max:
+            return distances.astype(np.int32, copy=False)
+        return distances.astype(np.int64, copy=False)
+    return distances.astype(np.float32, copy=False)
+
+# Full distance matrix from coordinates with cdist, one block of rows at a time
+# into a float32 result. "haversine" expects (lat, lon) in degrees: the points go
+# on the unit sphere, and the great-circle distance is 2R asin(chord / 2) of the
+# Euclidean chord.
+def distance_matrix(points, metric="euclidean"):
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    if n > MATRIX_MAX_CITIES:
+        raise ValueError(f"Distance matrices are limited to {MATRIX_MAX_CITIES} cities.")
+    if metric == "haversine":
+        lat, lon = np.radians(points[:, 0]), np.radians(points[:, 1])
+        points = np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+    elif metric != "euclidean":
+        raise ValueError(f"Unknown metric: {metric}")
+    distances = np.empty((n, n), dtype=np.float32)
+    for lo in range(0, n, CDIST_BLOCK):
+        block = distances[lo:lo + CDIST_BLOCK]
+        block[:] = cdist(points[lo:lo + CDIST_BLOCK], points)
+        if metric == "haversine":
+            block *= 0.5
+            np.minimum(block, 1.0, out=block)
+            np.arcsin(block, out=block)
+            block *= 2 * EARTH_RADIUS_KM
+    return distances
+
+SYMMETRY_TILE = 256
+
+# Pairs with d[i, j] != d[j, i] (within float tolerance) as (count, first pair).
+# Tiles are compared against their transposed partner tile, so both reads stay
+# cache friendly instead of walking the whole transpose.
+def asymmetric_pairs(distances):
+    n = len(distances)
+    exact = np.issubdtype(distances.dtype, np.integer)
+    count, first = 0, None
+    for i in range(0, n, SYMMETRY_TILE):
+        for j in range(i, n, SYMMETRY_TILE):
+            a = distances[i:i + SYMMETRY_TILE, j:j + SYMMETRY_TILE]
+            b = distances[j:j + SYMMETRY_TILE, i:i + SYMMETRY_TILE].T
+            bad = a != b if exact else np.abs(a - b) > 1e-6 + 1e-5 * np.abs(b)
+            if i == j:
+                bad = np.triu(bad, 1)
+            hits = np.count_nonzero(bad)
+            if hits:
+                count += hits
+                if first is None:
+                    r, c = np.argwhere(bad)[0]
+                    first = (i + int(r), j + int(c))
+    return count, first
+
+# Problems with a distance matrix as messages (empty when it is usable), all
+# checked with whole-array operations
+def validate_distances(distances):
+    if distances.ndim != 2 or distances.shape[0] != distances.shape[1]:
+        return [f"Distance matrix must be square, got shape {distances.shape}."]
+    errors = []
+    if not np.isfinite(distances).all():
+        errors.append("Distances must be finite numbers.")
+    if (distances < 0).any():
+        errors.append("Distances must not be negative.")
+    bad = np.flatnonzero(np.diagonal(distances))
+    if len(bad):
+        errors.append(f"Distance from a city to itself must be 0 (City {bad[0] + 1}"
+                      f"{f' and {len(bad) - 1} more' if len(bad) > 1 else ''}).")
+    count, first = asymmetric_pairs(distances)
+    if count:
+        i, j = first
+        errors.append(f"Distances must be symmetric: distance[{i+1}, {j+1}] != distance[{j+1}, {i+1}] "
+                      f"({count} pair(s) differ).")
+    return errors
+
+def load_distance_matrix(data):
+    distances = np.load(io.BytesIO(data), allow_pickle=False)
+    if not (np.issubdtype(distances.dtype, np.integer) or np.issubdtype(distances.dtype, np.floating)):
+        raise ValueError(f"unsupported matrix dtype {distances.dtype}")
+    return compact_distances(distances)
+
+# City coordinates from CSV: columns x, y or lat, lon (latitude / longitude / lng
+# also accepted), plus an optional name column. Returns (points, names, is_geographic).
+def load_coordinates(data):
+    frame = pd.read_csv(io.BytesIO(data))
+    frame.columns = [str(col).strip().lower() for col in frame.columns]
+    aliases = {"latitude": "lat", "longitude": "lon", "lng": "lon", "long": "lon"}
+    frame = frame.rename(columns=aliases)
+    if {"lat", "lon"} <= set(frame.columns):
+        columns, geographic = ["lat", "lon"], True
+    elif {"x", "y"} <= set(frame.columns):
+        columns, geographic = ["x", "y"], False
+    else:
+        raise ValueError("expected columns x, y or lat, lon")
+    points = frame[columns].to_numpy(dtype=np.float64)
+    if not np.isfinite(points).all():
+        raise ValueError("coordinates must be finite numbers")
+    if geographic and ((np.abs(points[:, 0]) > 90).any() or (np.abs(points[:, 1]) > 180).any()):
+        raise ValueError("latitude must be within ±90 and longitude within ±180")
+    names = (frame["name"].astype(str).tolist() if "name" in frame.columns
+             else [f"City {i + 1}" for i in range(len(frame))])
+    return points, names, geographic
+
+def is_exact_size(n):
+    return n <= EXACT_CITIES
+
+# Exact Held-Karp when it fits, otherwise the heuristic on the matrix, or on the
+# points directly (Euclidean, no matrix) when only points are given. stats gets
+# "exact" plus the heuristic's figures.
+def solve_tsp(distances=None, time_budget=5.0, stats=None, points=None, construction="nearest"):
+    n = len(distances) if distances is not None else len(points)
+    if stats is not None:
+        stats["exact"] = is_exact_size(n)
+    if is_exact_size(n):
+        if distances is None:
+            distances = distance_matrix(points, "euclidean")
+        return solve_tsp_held_karp(distances)
+    return solve_tsp_heuristic(points if distances is None else None, time_budget=time_budget,
+                               construction=construction, stats=stats, distances=distances)
+
+def plot_tour(points, route, geographic=False):
+    fig, ax = plt.subplots(figsize=(7, 7))
+    xy = points[:, ::-1] if geographic else points  # plot lon across, lat up
+    closed = xy[route + route[:1]]
+    ax.plot(closed[:, 0], closed[:, 1], '-', color='steelblue', linewidth=0.8)
+    ax.scatter(xy[:, 0], xy[:, 1], s=6 if len(xy) > 200 else 20, color='black', zorder=3)
+    ax.scatter(xy[route[0], 0], xy[route[0], 1], s=60, color='red', zorder=4, label='Start')
+    if geographic:
+        ax.set_xlabel('Longitude')
+        ax.set_ylabel('Latitude')
+    else:
+        ax.set_aspect('equal')
+    ax.legend(loc='upper right')
+    ax.set_title(f'Tour through {len(points)} cities')
+    return fig
+
+# Upper-triangle inputs only: the lower triangle is the transpose, built after all
+# inputs are read, so no widget ever shows a mirrored value from the previous run
+def distance_grid_input(n):
+    st.markdown("### Enter Distances Between Cities:")
+    upper = np.zeros((n, n), dtype=np.int32)
+    for i in range(n - 1):
+        row_cols = st.columns(n - 1)
+        for j in range(i + 1, n):
+            upper[i, j] = row_cols[j - 1].number_input(
+                f"City {i+1}→City {j+1}", value=0, min_value=0, max_value=10000, key=f"dist_{i}_{j}"
+            )
+    distances = upper + upper.T
+    with st.expander("🔍 Full distance matrix"):
+        st.dataframe(pd.DataFrame(distances, index=[f"City {i+1}" for i in range(n)],
+                                  columns=[f"City {j+1}" for j in range(n)]))
+    return distances
+
+TSP_SOURCES = ["✍️ Distance grid", "📍 Coordinates (CSV)", "🎲 Random cities", "🧮 Distance matrix (.npy)"]
+
 def run_tsp_app():
     st.title("🚗 Travel Route Planner (TSP)")
-    st.markdown("""
+    st.markdown(f"""
     Find the **shortest route** visiting each city exactly once and returning to the starting city.  
     Useful for logistics, delivery optimization, and travel planning.
 
     **Instructions:**  
-    - Select the number of cities (3 to 8).  
-    - Enter distances between cities in the grid below (distance from City i to City j).  
-    - Distance from a city to itself must be 0.  
-    - Distances must be symmetric (distance from City i to City j equals City j to City i).
+    - **Distance grid**: select 3 to 12 cities and enter the distance for each pair (the grid is mirrored).  
+    - **Coordinates**: upload a CSV with columns `x, y` or `lat, lon` (optional `name`).  
+    - **Random cities**: generate points for quick experiments.  
+    - **Distance matrix**: upload a square, symmetric `.npy` matrix with zeros on the diagonal.  
+    - Up to {EXACT_CITIES} cities are solved **exactly** (Held-Karp); larger inputs use **2-opt / Or-opt** within a time budget.
     """)
 
-    n = st.slider("Number of Cities (Max 8)", 3, 8, 4)
+    source = st.radio("📥 City Input", TSP_SOURCES, horizontal=True)
+    points, distances, names, geographic = None, None, None, False
 
-    st.markdown("### Enter Distances Between Cities:")
+    if source == TSP_SOURCES[0]:
+        n = st.slider("Number of Cities (Max 12)", 3, 12, 4)
+        distances = distance_grid_input(n)
+    elif source == TSP_SOURCES[1]:
+        upload = st.file_uploader("City coordinates", type=["csv"])
+        if upload is None:
+            return
+        try:
+            points, names, geographic = load_coordinates(upload.getvalue())
+        except Exception as e:
+            st.error(f"⚠️ Could not read the coordinates: {e}")
+            return
+    elif source == TSP_SOURCES[2]:
+        col1, col2 = st.columns(2)
+        with col1:
+            n = st.number_input("Number of Cities", min_value=3, max_value=20000, value=500, step=100)
+        with col2:
+            seed = st.number_input("Random Seed", min_value=0, value=0)
+        points = np.random.default_rng(int(seed)).random((int(n), 2)) * 1000
+    else:
+        upload = st.file_uploader("Distance matrix", type=["npy"])
+        if upload is None:
+            return
+        try:
+            distances = load_distance_matrix(upload.getvalue())
+        except Exception as e:
+            st.error(f"⚠️ Could not read the matrix: {e}")
+            return
 
-    # Create an n x n numpy array to hold distances, initialized with zeros
-    distances = np.zeros((n, n), dtype=int)
-
-    # Input grid for distances
-    cols = st.columns(n)
-    for i in range(n):
-        with st.container():
-            row_cols = st.columns(n)
-            for j in range(n):
-                if i == j:
-                    # Diagonal fixed to 0 and disabled input
-                    distances[i][j] = 0
-                    row_cols[j].number_input(
-                        f"City {i+1}→City {j+1}", 
-                        value=0, min_value=0, max_value=0, key=f"dist_{i}_{j}", disabled=True
-                    )
-                elif j < i:
-                    # For lower triangle, mirror upper triangle input
-                    distances[i][j] = distances[j][i]
-                    row_cols[j].number_input(
-                        f"City {i+1}→City {j+1}",
-                        value=distances[i][j], min_value=0, max_value=10000, key=f"dist_{i}_{j}", disabled=True
-                    )
-                else:
-                    # Upper triangle and off diagonal inputs
-                    distances[i][j] = row_cols[j].number_input(
-                        f"City {i+1}→City {j+1}",
-                        value=distances[i][j], min_value=0, max_value=10000, key=f"dist_{i}_{j}"
-                    )
-                    # Mirror value to lower triangle to keep symmetric
-                    distances[j][i] = distances[i][j]
-
-    if st.button("🧠 Find Optimal Route"):
-        # Validate distances array
-        valid = True
-        for i in range(n):
-            if distances[i][i] != 0:
-                st.error(f"Distance from City {i+1} to itself must be 0.")
-                valid = False
-            for j in range(n):
-                if distances[i][j] != distances[j][i]:
-                    st.error(f"Distances must be symmetric: distance[{i+1}, {j+1}] != distance[{j+1}, {i+1}]")
-                    valid = False
-
-        if not valid:
-            st.stop()
+    n = len(points) if points is not None else len(distances)
+    if n < 3:
+        st.error("❌ At least 3 cities are needed.")
+        return
+    if points is not None:
+        metric = "euclidean"
+        if geographic:
+            metric = "haversine"
+            st.caption("Coordinates are latitude/longitude, so distances are great-circle kilometres (haversine).")
+        if metric == "haversine" or is_exact_size(n):
+            try:
+                started = time.perf_counter()
+                distances = distance_matrix(points, metric)
+            except Exception as e:
+                st.error(f"❌ {e}")
+                return
+            st.caption(f"Built a {n} × {n} {distances.dtype} matrix "
+                       f"({distances.nbytes / 2 ** 20:.1f} MB) in {(time.perf_counter() - started) * 1000:.0f} ms.")
+    if names is None:
+        names = [f"City {i + 1}" for i in range(n)]
 
+    exact = is_exact_size(n)
+    construction, time_budget = "Nearest neighbor", 10
+    if not exact:
+        col1, col2 = st.columns(2)
+        with col1:
+            construction = st.radio("Starting Tour", ["Nearest neighbor", "Greedy edge"])
+        with col2:
+            time_budget = st.slider("⏱️ Time Budget (seconds)", 1, 60, 10)
+
+    if st.button("🧠 Find Optimal Route" if exact else "🧠 Plan Route"):
+        if distances is not None:
+            errors = validate_distances(distances)
+            for error in errors:
+                st.error(error)
+            if errors:
+                st.stop()
+
+        stats = {}
         try:
-            best_route, min_distance = solve_tsp_brute_force(distances)
-            city_names = [f"City {i+1}" for i in best_route]
-            st.success(f"✅ Optimal Route: {' → '.join(city_names)} → City 1")
-            st.write(f"📏 Total Distance: {min_distance}")
+            with st.spinner("Solving..."):
+                best_route, min_distance = solve_tsp(
+                    distances, time_budget=time_budget, stats=stats, points=points if distances is None else None,
+                    construction="greedy" if construction == "Greedy edge" else "nearest")
         except Exception as e:
             st.error(f"❌ Error solving TSP: {e}")
+            return
+
+        if exact:
+            city_names = [names[i] for i in best_route]
+            st.success(f"✅ Optimal Route: {' → '.join(city_names)} → {names[best_route[0]]}")
+            st.write(f"📏 Total Distance: {min_distance:,.2f}" if isinstance(min_distance, float)
+                     else f"📏 Total Distance: {min_distance}")
+        else:
+            st.success(f"✅ Route Length: {min_distance:,.1f}")
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("Starting Tour", f"{stats['start_length']:,.1f}")
+            c2.metric("Lower Bound", f"{stats['lower_bound']:,.1f}")
+            c3.metric("Gap to Bound", f"{stats['gap']:.1%}")
+            c4.metric("Iterations", f"{stats['iterations']:,}")
+            st.caption(f"{stats['checked']:,} cities checked in {stats['seconds']:.2f} s")
+        if points is not None:
+            st.pyplot(plot_tour(points, best_route, geographic))
 
 if __name__ == "__main__":
     run_tsp_app()